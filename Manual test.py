@@ -52,31 +52,64 @@ LETTER = {  # fallback letters if glyphs unavailable
     chess.KING:   {chess.WHITE: "K", chess.BLACK: "k"},
 }
 
+# Flat per-piece tables indexed by (piece_type << 1) | (0 if white else 1);
+# slots 0-1 are unused because piece types start at 1.
+GLYPH_UNICODE = (None, None) + tuple(UNICODE[pt][col] for pt in range(chess.PAWN, chess.KING + 1)
+                                     for col in (chess.WHITE, chess.BLACK))
+GLYPH_LETTER  = (None, None) + tuple(LETTER[pt][col] for pt in range(chess.PAWN, chess.KING + 1)
+                                     for col in (chess.WHITE, chess.BLACK))
+
 # ============================================================
 #                        FONT HELPERS
 # ============================================================
 
+# Pre-rendered piece glyphs in the flat GLYPH_* layout: (surface, (dx, dy)),
+# where (dx, dy) centers the glyph inside a square. Filled by get_fonts().
+PIECE_SURFS = [None] * 14
+
+def build_piece_surfs(font_piece, has_unicode):
+    """Render the 12 piece glyphs once so drawing is a plain blit."""
+    glyphs = GLYPH_UNICODE if has_unicode else GLYPH_LETTER
+    for idx in range(2, 14):
+        surf = font_piece.render(glyphs[idx], True, (15, 15, 15)).convert_alpha()
+        offset = ((SQUARE - surf.get_width()) // 2, (SQUARE - surf.get_height()) // 2)
+        PIECE_SURFS[idx] = (surf, offset)
+
 def get_fonts():
     """
     Return (piece_font, small_font, ui_font, title_font, has_unicode).
     Title font slightly larger, non-bold for sharper rendering.
+    Also fills PIECE_SURFS for the chosen piece font.
     """
+    fonts = None
+    size_piece = int(SQUARE * 0.82)
     candidates = ["Apple Symbols", "Arial Unicode MS", "DejaVu Sans", None]  # None = default
     for name in candidates:
         try:
-            f_piece = pygame.font.SysFont(name, int(SQUARE * 0.82))
+            # Resolve the font file once; SysFont would rescan the system fonts per size.
+            path = pygame.font.match_font(name) if name else None
+            f_piece = pygame.font.Font(path, size_piece)
             if f_piece.render("♔♕♖♗♘♙", True, (0,0,0)).get_width() > 0:
-                return (
+                fonts = (
                     f_piece,
-                    pygame.font.SysFont(name, 18),
-                    pygame.font.SysFont(name, 22),
-                    pygame.font.SysFont(name, 42, bold=False),
+                    pygame.font.Font(path, 18),
+                    pygame.font.Font(path, 22),
+                    pygame.font.Font(path, 42),
                     True,
                 )
+                break
         except Exception:
             pass
-    base = pygame.font.SysFont(None, int(SQUARE * 0.82))
-    return base, pygame.font.SysFont(None, 18), pygame.font.SysFont(None, 22), pygame.font.SysFont(None, 42, bold=False), False
+    if fonts is None:
+        fonts = (
+            pygame.font.Font(None, size_piece),
+            pygame.font.Font(None, 18),
+            pygame.font.Font(None, 22),
+            pygame.font.Font(None, 42),
+            False,
+        )
+    build_piece_surfs(fonts[0], fonts[4])
+    return fonts
 
 # ============================================================
 #                ORIENTATION / GEOMETRY HELPERS
@@ -101,30 +134,70 @@ def fr_to_xy(sf: int, sr: int):
     y = MARGIN + (7 - sr) * SQUARE
     return x, y
 
+BOARD_END = MARGIN + 8 * SQUARE   # exclusive right/bottom pixel edge of the board
+
+def _build_orientation_luts(bottom_color: bool):
+    """Square<->screen-cell tables; a screen cell is encoded as sf*8 + sr."""
+    to_screen = [0] * 64
+    to_board  = [0] * 64
+    for sq in range(64):
+        sf, sr = board_to_screen_fr(sq & 7, sq >> 3, bottom_color)
+        code = (sf << 3) | sr
+        to_screen[sq] = code
+        to_board[code] = sq
+    return tuple(to_screen), tuple(to_board)
+
+_LUTS = {color: _build_orientation_luts(color) for color in (chess.WHITE, chess.BLACK)}
+BOARD_TO_SCREEN_SQ = {color: luts[0] for color, luts in _LUTS.items()}
+SCREEN_TO_BOARD_SQ = {color: luts[1] for color, luts in _LUTS.items()}
+del _LUTS
+
 def mouse_to_board_square(mx: int, my: int, bottom_color: bool):
-    if not (MARGIN <= mx < MARGIN + 8 * SQUARE and MARGIN <= my < MARGIN + 8 * SQUARE):
+    if not (MARGIN <= mx < BOARD_END and MARGIN <= my < BOARD_END):
         return None
     sf = (mx - MARGIN) // SQUARE
-    sr_from_top = (my - MARGIN) // SQUARE
-    sr = 7 - sr_from_top
-    file_i, rank_i = screen_to_board_fr(sf, sr, bottom_color)
-    return chess.square(file_i, rank_i)
+    sr = 7 - (my - MARGIN) // SQUARE
+    return SCREEN_TO_BOARD_SQ[bottom_color][(sf << 3) | sr]
+
+def _build_square_xy(bottom_color: bool):
+    return [fr_to_xy(code >> 3, code & 7) for code in BOARD_TO_SCREEN_SQ[bottom_color]]
+
+# Top-left screen corner of each chess square (index = square), per orientation.
+# Geometry is fixed, so renderers index these instead of re-deriving per frame.
+SQ_XY = {color: _build_square_xy(color) for color in (chess.WHITE, chess.BLACK)}
 
 # ============================================================
 #                         UI HELPERS
 # ============================================================
 
+_TEXT_CACHE = {}        # (font, text, color) -> rendered Surface
+_TEXT_CACHE_MAX = 64
+
+def render_cached(font, text, color):
+    key = (font, text, color)
+    surf = _TEXT_CACHE.get(key)
+    if surf is None:
+        if len(_TEXT_CACHE) >= _TEXT_CACHE_MAX:
+            del _TEXT_CACHE[next(iter(_TEXT_CACHE))]
+        surf = font.render(text, True, color).convert_alpha()
+        _TEXT_CACHE[key] = surf
+    return surf
+
 def draw_button(screen, rect, text, font, hovered=False):
     pygame.draw.rect(screen, COL_BTN_H if hovered else COL_BTN, rect, border_radius=10)
-    label = font.render(text, True, COL_TEXT)
+    label = render_cached(font, text, COL_TEXT)
     screen.blit(label, (rect.centerx - label.get_width()//2, rect.centery - label.get_height()//2))
 
+# Screen cells split by shade; (sf + sr) even is a dark square.
+DARK_RECTS  = [(*fr_to_xy(sf, sr), SQUARE, SQUARE) for sf in range(8) for sr in range(8) if (sf + sr) % 2 == 0]
+LIGHT_RECTS = [(*fr_to_xy(sf, sr), SQUARE, SQUARE) for sf in range(8) for sr in range(8) if (sf + sr) % 2 == 1]
+
 def draw_board_squares(screen):
-    for sf in range(8):
-        for sr in range(8):
-            x, y = fr_to_xy(sf, sr)
-            color = COL_DARK if (sf + sr) % 2 == 0 else COL_LIGHT
-            pygame.draw.rect(screen, color, (x, y, SQUARE, SQUARE))
+    fill = screen.fill
+    for rect in DARK_RECTS:
+        fill(COL_DARK, rect)
+    for rect in LIGHT_RECTS:
+        fill(COL_LIGHT, rect)
 
 def draw_file_labels(screen, font_small, bottom_color):
     files = "abcdefgh" if bottom_color == chess.WHITE else "hgfedcba"
@@ -142,62 +215,128 @@ def draw_rank_labels(screen, font_small, bottom_color):
         lab = font_small.render(number, True, COL_TEXT)
         screen.blit(lab, (lx, ly))
 
+def build_background(font_small, bottom_color):
+    """Bake squares, file/rank labels and the UI bar into one opaque surface."""
+    bg = pygame.Surface((WIN_W, WIN_H))
+    bg.fill(COL_BG)
+    draw_board_squares(bg)
+    draw_file_labels(bg, font_small, bottom_color)
+    draw_rank_labels(bg, font_small, bottom_color)
+    pygame.draw.rect(bg, (36, 36, 36), (0, BOARD_PIXELS + UI_PAD, WIN_W, UI_HEIGHT))
+    return bg.convert()
+
+DOT_R  = max(6, SQUARE // 8)
+DOT_XY = {color: [(x + SQUARE // 2 - DOT_R, y + SQUARE // 2 - DOT_R) for x, y in SQ_XY[color]]
+          for color in (chess.WHITE, chess.BLACK)}
+
+# Overlay pool: translucent surfaces allocated once by build_overlays() and
+# re-blitted every frame instead of being recreated per draw.
+HI_SURF   = None   # last-move highlight (shared by both squares)
+CHK_SURF  = None   # king-in-check tint
+DOT_SURF  = None   # legal-move dot
+OVER_SURF = None   # full-window game-over dimmer
+
+def build_overlays():
+    global HI_SURF, CHK_SURF, DOT_SURF, OVER_SURF
+    HI_SURF = pygame.Surface((SQUARE, SQUARE), pygame.SRCALPHA)
+    HI_SURF.fill(COL_HI)
+    HI_SURF = HI_SURF.convert_alpha()
+    CHK_SURF = pygame.Surface((SQUARE, SQUARE), pygame.SRCALPHA)
+    CHK_SURF.fill(COL_CHECK)
+    CHK_SURF = CHK_SURF.convert_alpha()
+    DOT_SURF = pygame.Surface((2 * DOT_R + 1, 2 * DOT_R + 1), pygame.SRCALPHA)
+    pygame.draw.circle(DOT_SURF, COL_DOT, (DOT_R, DOT_R), DOT_R)
+    DOT_SURF = DOT_SURF.convert_alpha()
+    OVER_SURF = pygame.Surface((WIN_W, WIN_H), pygame.SRCALPHA)
+    OVER_SURF.fill(COL_OVER)
+    OVER_SURF = OVER_SURF.convert_alpha()
+
 def draw_last_move(screen, move, bottom_color):
     if not move:
         return
     for sq in (move.from_square, move.to_square):
-        fi = chess.square_file(sq); ri = chess.square_rank(sq)
-        sf, sr = board_to_screen_fr(fi, ri, bottom_color)
-        x, y = fr_to_xy(sf, sr)
-        hi = pygame.Surface((SQUARE, SQUARE), pygame.SRCALPHA)
-        hi.fill(COL_HI)
-        screen.blit(hi, (x, y))
+        screen.blit(HI_SURF, SQ_XY[bottom_color][sq])
 
 def draw_selection_outline(screen, sel_sq, bottom_color):
     if sel_sq is None:
         return
-    fi = chess.square_file(sel_sq); ri = chess.square_rank(sel_sq)
-    sf, sr = board_to_screen_fr(fi, ri, bottom_color)
-    x, y = fr_to_xy(sf, sr)
+    x, y = SQ_XY[bottom_color][sel_sq]
     pygame.draw.rect(screen, COL_SEL, (x+2, y+2, SQUARE-4, SQUARE-4), width=3, border_radius=6)
 
+def blit_batch(screen, seq):
+    """Submit many (surface, pos) pairs in one call (fblits on pygame-ce)."""
+    if hasattr(screen, "fblits"):
+        screen.fblits(seq)
+    else:
+        screen.blits(seq, doreturn=0)
+
 def draw_legal_dots(screen, legal_targets, bottom_color):
-    dot_r = max(6, SQUARE // 8)
-    for tsq in list(legal_targets):
-        try:
-            fi = chess.square_file(tsq); ri = chess.square_rank(tsq)
-            sf, sr = board_to_screen_fr(fi, ri, bottom_color)
-            cx = MARGIN + sf * SQUARE + SQUARE // 2
-            cy = MARGIN + (7 - sr) * SQUARE + SQUARE // 2
-            pygame.draw.circle(screen, COL_DOT, (cx, cy), dot_r)
-        except Exception:
-            legal_targets.discard(tsq)
-
-def draw_check_overlay(screen, board, bottom_color):
-    if board.is_check():
-        ksq = board.king(board.turn)
-        if ksq is not None:
-            kf = chess.square_file(ksq); kr = chess.square_rank(ksq)
-            sf, sr = board_to_screen_fr(kf, kr, bottom_color)
-            x, y = fr_to_xy(sf, sr)
-            chk = pygame.Surface((SQUARE, SQUARE), pygame.SRCALPHA)
-            chk.fill(COL_CHECK)
-            screen.blit(chk, (x, y))
-
-def draw_pieces(screen, board, font_piece, has_unicode, bottom_color, skip_sq=None):
-    for sq in chess.SQUARES:
-        if skip_sq is not None and sq == skip_sq:
-            continue
-        piece = board.piece_at(sq)
-        if not piece:
+    xy = DOT_XY[bottom_color]
+    blit_batch(screen, [(DOT_SURF, xy[tsq]) for tsq in legal_targets])
+
+def draw_check_overlay(screen, check_sq, bottom_color):
+    if check_sq is not None:
+        screen.blit(CHK_SURF, SQ_XY[bottom_color][check_sq])
+
+def draw_pieces(screen, mailbox, bottom_color, skip_sq=None):
+    xy, surfs = SQ_XY[bottom_color], PIECE_SURFS
+    seq = []
+    add = seq.append
+    for sq in range(64):
+        piece = mailbox[sq]
+        if not piece or sq == skip_sq:
             continue
-        fi = chess.square_file(sq); ri = chess.square_rank(sq)
-        sf, sr = board_to_screen_fr(fi, ri, bottom_color)
-        x, y = fr_to_xy(sf, sr)
-        glyph = UNICODE[piece.piece_type][piece.color] if has_unicode else LETTER[piece.piece_type][piece.color]
-        surf  = font_piece.render(glyph, True, (15, 15, 15))
-        screen.blit(surf, (x + (SQUARE - surf.get_width())//2,
-                           y + (SQUARE - surf.get_height())//2))
+        x, y = xy[sq]
+        surf, (dx, dy) = surfs[(piece.piece_type << 1) | (0 if piece.color else 1)]
+        add((surf, (x + dx, y + dy)))
+    blit_batch(screen, seq)
+
+# ============================================================
+#                     LEGAL-MOVE CACHE
+# ============================================================
+
+_LEGAL_CACHE = {}       # transposition key -> [{from_sq: frozenset(to_sqs)}, frozenset(moves) | None]
+_LEGAL_CACHE_MAX = 512
+
+def _legal_entry(board):
+    """
+    Per-position legal-move record (keyed by python-chess' transposition key),
+    shared by selection highlights and move validation. Both halves are
+    filled on demand, so a position only pays for what it is asked about.
+    """
+    key = board._transposition_key()
+    entry = _LEGAL_CACHE.get(key)
+    if entry is None:
+        if len(_LEGAL_CACHE) >= _LEGAL_CACHE_MAX:
+            _LEGAL_CACHE.clear()
+        entry = _LEGAL_CACHE[key] = [{}, None]
+    return entry
+
+def legal_targets_for(board, sq):
+    """To-squares reachable from sq; only moves of that piece are generated."""
+    by_from = _legal_entry(board)[0]
+    targets = by_from.get(sq)
+    if targets is None:
+        targets = by_from[sq] = frozenset(
+            m.to_square for m in board.generate_legal_moves(from_mask=chess.BB_SQUARES[sq]))
+    return set(targets)
+
+def legal_move_set(board):
+    """Hashable set of the position's legal moves for O(1) membership tests."""
+    entry = _legal_entry(board)
+    if entry[1] is None:
+        entry[1] = frozenset(board.legal_moves)
+    return entry[1]
+
+def board_view(board):
+    """
+    Render snapshot of the board: a 64-entry mailbox of pieces and the
+    square of the side-to-move's king when it is in check (else None).
+    Refresh after every push/pop so drawing never touches the bitboards.
+    """
+    mailbox = [board.piece_at(sq) for sq in range(64)]
+    check_sq = board.king(board.turn) if board.is_check() else None
+    return mailbox, check_sq
 
 def try_make_move(board, from_sq, to_sq):
     if from_sq == to_sq:
@@ -205,9 +344,9 @@ def try_make_move(board, from_sq, to_sq):
     uci = chess.square_name(from_sq) + chess.square_name(to_sq)
     move = chess.Move.from_uci(uci)
     piece = board.piece_at(from_sq)
-    if piece and piece.piece_type == chess.PAWN and chess.square_rank(to_sq) in (0, 7):
+    if piece and piece.piece_type == chess.PAWN and (to_sq >> 3) in (0, 7):
         move = chess.Move.from_uci(uci + "q")
-    if move in board.legal_moves:
+    if move in legal_move_set(board):
         board.push(move)
         print("move:", move.uci())
         return True
@@ -230,34 +369,33 @@ def game_over_reason(board: chess.Board):
         return True, "Stalemate — draw", "1/2-1/2"
     if hasattr(board, "is_seventyfive_moves") and board.is_seventyfive_moves():
         return True, "75-move rule — draw", "1/2-1/2"
-    if hasattr(board, "is_fivefold_repetition") and board.is_fivefold_repetition():
-        return True, "Fivefold repetition — draw", "1/2-1/2"
     if board.is_insufficient_material():
         return True, "Insufficient material — draw", "1/2-1/2"
+    # Repetition checks walk the move history; keep them last.
+    if hasattr(board, "is_fivefold_repetition") and board.is_fivefold_repetition():
+        return True, "Fivefold repetition — draw", "1/2-1/2"
     if board.is_repetition(3) or board.can_claim_threefold_repetition():
         return True, "Threefold repetition — draw", "1/2-1/2"
     return False, "", "*"
 
 def draw_game_over_overlay(screen, fonts, reason_text):
     _, font_small, font_ui, font_title, _ = fonts
-    overlay = pygame.Surface((WIN_W, WIN_H), pygame.SRCALPHA)
-    overlay.fill(COL_OVER)
-    screen.blit(overlay, (0, 0))
+    screen.blit(OVER_SURF, (0, 0))
 
     box_w, box_h = 520, 220
     rect = pygame.Rect((WIN_W - box_w)//2, (WIN_H - box_h)//2 - 20, box_w, box_h)
     pygame.draw.rect(screen, (40, 40, 44), rect, border_radius=12)
     pygame.draw.rect(screen, (70, 70, 74), rect, width=2, border_radius=12)
 
-    title = font_title.render("Game Over", True, COL_TEXT)
+    title = render_cached(font_title, "Game Over", COL_TEXT)
     screen.blit(title, (rect.centerx - title.get_width()//2, rect.y + 18))
 
-    reason = font_ui.render(reason_text, True, COL_ACC)
+    reason = render_cached(font_ui, reason_text, COL_ACC)
     screen.blit(reason, (rect.centerx - reason.get_width()//2, rect.y + 78))
 
     btn = pygame.Rect(rect.centerx - 100, rect.bottom - 70, 200, 48)
     pygame.draw.rect(screen, COL_BTN, btn, border_radius=10)
-    label = font_ui.render("New Game", True, COL_TEXT)
+    label = render_cached(font_ui, "New Game", COL_TEXT)
     screen.blit(label, (btn.centerx - label.get_width()//2, btn.centery - label.get_height()//2))
     return btn
 
@@ -273,7 +411,7 @@ def show_menu(screen, fonts):
     cx = w // 2
 
     title_text = "Choose Color & Difficulty"
-    title_surf = font_title.render(title_text, True, COL_TEXT)
+    title_surf = font_title.render(title_text, True, COL_TEXT).convert_alpha()
     title_h    = title_surf.get_height()
 
     btn_w, btn_h = 180, 56
@@ -341,7 +479,7 @@ def show_menu(screen, fonts):
 
         def draw_choice(rect, label, active):
             pygame.draw.rect(screen, COL_BTN_H if active else COL_BTN, rect, border_radius=10)
-            lab = font_ui.render(label, True, COL_TEXT)
+            lab = render_cached(font_ui, label, COL_TEXT)
             screen.blit(lab, (rect.centerx - lab.get_width()//2, rect.centery - lab.get_height()//2))
 
         draw_choice(white_btn, "White", chosen_color == chess.WHITE)
@@ -350,16 +488,16 @@ def show_menu(screen, fonts):
         for lvl, rect in diff_btns:
             active = (chosen_diff == lvl)
             pygame.draw.rect(screen, COL_BTN_H if active else COL_BTN, rect, border_radius=8)
-            lab = font_ui.render(str(lvl), True, COL_TEXT)
+            lab = render_cached(font_ui, str(lvl), COL_TEXT)
             screen.blit(lab, (rect.centerx - lab.get_width()//2, rect.centery - lab.get_height()//2))
 
         ready = (chosen_color is not None and chosen_diff is not None)
         pygame.draw.rect(screen, (0, 140, 80) if ready else (60, 60, 60), start_btn, border_radius=10)
-        start_txt = font_ui.render("Start Game", True, (255, 255, 255) if ready else (200, 200, 200))
+        start_txt = render_cached(font_ui, "Start Game", (255, 255, 255) if ready else (200, 200, 200))
         screen.blit(start_txt, (start_btn.centerx - start_txt.get_width()//2, start_btn.centery - start_txt.get_height()//2))
 
         pygame.display.flip()
-        pygame.time.Clock().tick(60)
+        clock.tick(60)
 
 # ============================================================
 #                           MAIN
@@ -372,11 +510,18 @@ def main():
     clock  = pygame.time.Clock()
 
     fonts = get_fonts()
+    build_overlays()
     font_piece, font_small, font_ui, font_title, has_unicode = fonts
 
+    bg, bg_color = None, None  # static background, rebuilt on orientation change
+
     while True:  # menu loop (Reset/New Game both return here)
         bottom_color, difficulty = show_menu(screen, fonts)
         board = chess.Board()
+        mailbox, check_sq = board_view(board)
+        if bg is None or bg_color != bottom_color:
+            bg = build_background(font_small, bottom_color)
+            bg_color = bottom_color
 
         # selection / dragging state
         selected_sq   = None
@@ -403,23 +548,37 @@ def main():
         over_reason   = ""
         over_btn_rect = None
         result_str    = "*"
+        checked_ply   = -1     # move-stack length game_over_reason last ran for
+
+        # redraw bookkeeping: only render + present frames that changed
+        dirty       = True
+        hover_undo  = False
+        hover_reset = False
 
         running_game = True
         while running_game:
+            # Sleep in SDL until input arrives unless a frame is pending or a drag is live
+            if dirty or dragging:
+                events = pygame.event.get()
+            else:
+                first = pygame.event.wait(100)
+                events = [] if first.type == pygame.NOEVENT else [first]
+                events += pygame.event.get()
+
             mx, my = pygame.mouse.get_pos()
+            hover_prev  = (hover_undo, hover_reset)
             hover_undo  = btn_undo.collidepoint(mx, my)
             hover_reset = btn_reset.collidepoint(mx, my)
+            if (hover_undo, hover_reset) != hover_prev:
+                dirty = True
 
-            # Check game-over status
-            if not is_over:
-                is_over, over_reason, result_str = game_over_reason(board)
-                if is_over:
-                    print(f'end_game reason="{over_reason}" result={result_str}')
-
-            for event in pygame.event.get():
+            for event in events:
                 if event.type == pygame.QUIT:
                     pygame.quit(); sys.exit(0)
 
+                if event.type != pygame.MOUSEMOTION or dragging:
+                    dirty = True
+
                 if is_over:
                     if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                         if hover_reset:
@@ -441,7 +600,9 @@ def main():
                         if board.move_stack:
                             popped = board.pop()
                             print("undo:", popped.uci())
+                            mailbox, check_sq = board_view(board)
                             last_move = board.move_stack[-1] if board.move_stack else None
+                            checked_ply = -1
                         selected_sq = None
                         legal_targets.clear()
                         dragging = False
@@ -460,10 +621,10 @@ def main():
                         legal_targets.clear()
                         press_pos = None
                     else:
-                        piece = board.piece_at(sq)
+                        piece = mailbox[sq]
                         if piece and piece.color == board.turn:
                             selected_sq   = sq
-                            legal_targets = {m.to_square for m in board.legal_moves if m.from_square == sq}
+                            legal_targets = legal_targets_for(board, sq)
                             dragging      = False
                             drag_from_sq  = None
                             drag_surface  = None
@@ -478,16 +639,14 @@ def main():
                         dy = my - press_pos[1]
                         if not dragging and (dx*dx + dy*dy) >= (DRAG_THRESH_PX * DRAG_THRESH_PX):
                             dragging = True
+                            dirty = True
                             drag_from_sq = selected_sq
-                            piece = board.piece_at(drag_from_sq)
+                            piece = mailbox[drag_from_sq]
                             if piece:
-                                glyph = UNICODE[piece.piece_type][piece.color] if has_unicode else LETTER[piece.piece_type][piece.color]
-                                drag_surface = font_piece.render(glyph, True, (15, 15, 15))
-                                fi = chess.square_file(drag_from_sq); ri = chess.square_rank(drag_from_sq)
-                                sf, sr = board_to_screen_fr(fi, ri, bottom_color)
-                                base_x, base_y = fr_to_xy(sf, sr)
-                                gx = base_x + (SQUARE - drag_surface.get_width()) // 2
-                                gy = base_y + (SQUARE - drag_surface.get_height()) // 2
+                                drag_surface, (dx0, dy0) = PIECE_SURFS[(piece.piece_type << 1) | (0 if piece.color else 1)]
+                                base_x, base_y = SQ_XY[bottom_color][drag_from_sq]
+                                gx = base_x + dx0
+                                gy = base_y + dy0
                                 drag_offset = (press_pos[0] - gx, press_pos[1] - gy)
 
                 elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
@@ -506,15 +665,16 @@ def main():
                             continue
 
                         if try_make_move(board, drag_from_sq, try_sq):
+                            mailbox, check_sq = board_view(board)
                             last_move = board.move_stack[-1] if board.move_stack else None
                             selected_sq = None
                             legal_targets.clear()
                         else:
                             if drop_sq is not None:
-                                p2 = board.piece_at(drop_sq)
+                                p2 = mailbox[drop_sq]
                                 if p2 and p2.color == board.turn:
                                     selected_sq = drop_sq
-                                    legal_targets = {m.to_square for m in board.legal_moves if m.from_square == drop_sq}
+                                    legal_targets = legal_targets_for(board, drop_sq)
                                 else:
                                     selected_sq = None
                                     legal_targets.clear()
@@ -539,59 +699,66 @@ def main():
                                     pass
                                 else:
                                     if try_make_move(board, selected_sq, sq):
+                                        mailbox, check_sq = board_view(board)
                                         last_move = board.move_stack[-1] if board.move_stack else None
                                         selected_sq = None
                                         legal_targets.clear()
                                     else:
-                                        p2 = board.piece_at(sq)
+                                        p2 = mailbox[sq]
                                         if p2 and p2.color == board.turn:
                                             selected_sq = sq
-                                            legal_targets = {m.to_square for m in board.legal_moves if m.from_square == sq}
+                                            legal_targets = legal_targets_for(board, sq)
                                         else:
                                             pass
 
                 elif event.type == pygame.KEYDOWN and event.key == pygame.K_q:
                     pygame.quit(); sys.exit(0)
 
+            # Check game-over status after this frame's input, so the
+            # move that ends the game and its overlay land in the same present
+            if not is_over and checked_ply != len(board.move_stack):
+                checked_ply = len(board.move_stack)
+                is_over, over_reason, result_str = game_over_reason(board)
+                if is_over:
+                    print(f'end_game reason="{over_reason}" result={result_str}')
+                    dirty = True
+
             # --------- RENDER ---------
-            screen.fill(COL_BG)
-            draw_board_squares(screen)
-            draw_last_move(screen, last_move, bottom_color)
-            draw_selection_outline(screen, selected_sq, bottom_color)
-            draw_legal_dots(screen, legal_targets, bottom_color)
-            draw_check_overlay(screen, board, bottom_color)
-
-            skip_sq = drag_from_sq if dragging else None
-            draw_pieces(screen, board, font_piece, has_unicode, bottom_color, skip_sq=skip_sq)
-
-            if dragging and drag_surface is not None:
-                mx, my = pygame.mouse.get_pos()
-                screen.blit(drag_surface, (mx - drag_offset[0], my - drag_offset[1]))
-
-            draw_file_labels(screen, font_small, bottom_color)
-            draw_rank_labels(screen, font_small, bottom_color)
-
-            pygame.draw.rect(screen, (36, 36, 36), (0, BOARD_PIXELS + UI_PAD, WIN_W, UI_HEIGHT))
-            draw_button(screen, btn_undo,  "Undo",  font_ui, hover_undo)
-            draw_button(screen, btn_reset, "Reset", font_ui, hover_reset)
-
-            info = f"Color: {'White' if bottom_color == chess.WHITE else 'Black'}   |   Difficulty: {difficulty}"
-            info_srf = font_ui.render(info, True, COL_ACC)
-            screen.blit(info_srf, (MARGIN, BOARD_PIXELS + UI_PAD + UI_HEIGHT - info_srf.get_height() - 10))
-
-            turn_txt = "White to move" if board.turn == chess.WHITE else "Black to move"
-            turn_srf = font_ui.render(turn_txt, True, COL_TEXT)
-            screen.blit(turn_srf, (WIN_W - MARGIN - turn_srf.get_width(), BOARD_PIXELS + UI_PAD + UI_HEIGHT - turn_srf.get_height() - 10))
-
-            over_btn_rect = None
-            is_over_now, over_reason, result_str = game_over_reason(board)
-            if is_over_now:
-                print(f'end_game reason="{over_reason}" result={result_str}')
-                over_btn_rect = draw_game_over_overlay(screen, fonts, over_reason)
-                # While overlay visible, inputs handled in event loop above
-
-            pygame.display.flip()
-            clock.tick(60)
+            if dirty:
+                screen.blit(bg, (0, 0))
+                draw_last_move(screen, last_move, bottom_color)
+                draw_selection_outline(screen, selected_sq, bottom_color)
+                draw_legal_dots(screen, legal_targets, bottom_color)
+                draw_check_overlay(screen, check_sq, bottom_color)
+
+                skip_sq = drag_from_sq if dragging else None
+                draw_pieces(screen, mailbox, bottom_color, skip_sq=skip_sq)
+
+                if dragging and drag_surface is not None:
+                    mx, my = pygame.mouse.get_pos()
+                    screen.blit(drag_surface, (mx - drag_offset[0], my - drag_offset[1]))
+
+                draw_button(screen, btn_undo,  "Undo",  font_ui, hover_undo)
+                draw_button(screen, btn_reset, "Reset", font_ui, hover_reset)
+
+                info = f"Color: {'White' if bottom_color == chess.WHITE else 'Black'}   |   Difficulty: {difficulty}"
+                info_srf = render_cached(font_ui, info, COL_ACC)
+                screen.blit(info_srf, (MARGIN, BOARD_PIXELS + UI_PAD + UI_HEIGHT - info_srf.get_height() - 10))
+
+                turn_txt = "White to move" if board.turn == chess.WHITE else "Black to move"
+                turn_srf = render_cached(font_ui, turn_txt, COL_TEXT)
+                screen.blit(turn_srf, (WIN_W - MARGIN - turn_srf.get_width(), BOARD_PIXELS + UI_PAD + UI_HEIGHT - turn_srf.get_height() - 10))
+
+                over_btn_rect = None
+                if is_over:
+                    over_btn_rect = draw_game_over_overlay(screen, fonts, over_reason)
+                    # While overlay visible, inputs handled in event loop above
+
+                pygame.display.update()
+                dirty = False
+
+            if dragging:
+                clock.tick(60)
 
 if __name__ == "__main__":
     main()
@@ -9,14 +9,18 @@ API_KEY = None                               # e.g., "your-moonraker-api-key" or
 SAFE_Z = 10                                  # mm to lift before fast XY moves (if you have Z)
 XY_FEED = 9000                               # mm/min (150 mm/s) adjust if needed
 DWELL_MS = 1200                              # default magnet on time if not provided via args
+TIMEOUT_S = 30                               # seconds; covers homing + dwell in one script
+
+# One keep-alive session for every request instead of a fresh connection per call
+_SESSION = requests.Session()
+_SESSION.headers.update({"Content-Type": "application/json"})
+if API_KEY:
+    _SESSION.headers["X-Api-Key"] = API_KEY
 
 def send_gcode(script: str):
     """Send one or multiple G-code lines to Moonraker."""
-    headers = {"Content-Type": "application/json"}
-    if API_KEY:
-        headers["X-Api-Key"] = API_KEY
-    r = requests.post(f"{MOONRAKER_URL}/printer/gcode/script",
-                      headers=headers, json={"script": script})
+    r = _SESSION.post(f"{MOONRAKER_URL}/printer/gcode/script",
+                      json={"script": script}, timeout=TIMEOUT_S)
     if r.status_code != 200:
         print(f"❌ {r.status_code}: {r.text}")
         sys.exit(1)
@@ -1,4 +1,4 @@
-]#!/usr/bin/env python3
+#!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
 Minimal Moonraker bridge for PrinterChess.
@@ -9,9 +9,19 @@ Minimal Moonraker bridge for PrinterChess.
 - Includes simple calibrate + quick CLI tests.
 """
 
-import os, time, json
+import os
+import logging
 import requests
-from typing import Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Optional, Tuple
+
+try:
+    import httpx  # optional: enables HTTP/2 when a proxy in front of Moonraker speaks it
+except ImportError:
+    httpx = None
+
+_log = logging.getLogger("chess_bridge")
 
 # ---------------- Moonraker endpoint ----------------
 # If running on the Pi, default is fine. From a laptop, set:
@@ -37,27 +47,63 @@ FEED_MOVE   = int(float(os.environ.get("CHESS_FEED",  "4200")))  # mm/min
 DWELL_PICK  = int(float(os.environ.get("CHESS_PICK",  "120")))   # ms
 DWELL_DROP  = int(float(os.environ.get("CHESS_DROP",  "100")))   # ms
 
+# Let Klipper do the square->XY math (CHESS_MOVE macro from chess_macros.cfg).
+# Board geometry then lives in the macro variables, not in set_workarea().
+USE_MOVE_MACRO = os.environ.get("CHESS_MOVE_MACRO", "0") == "1"
+
 
 # ==================== Low-level helpers ====================
 
+def _make_client():
+    """
+    One pooled keep-alive connection to Moonraker, reused by every send.
+    Prefers httpx (HTTP/2 if the 'h2' extra is installed); otherwise a
+    requests.Session. Retries live in the client's transport, not in Python,
+    and differ by path: the requests/urllib3 session retries connect errors
+    and 502/503/504 replies with backoff, while httpx's transport retries
+    connect errors only, so a gateway error surfaces on the first reply.
+    """
+    if httpx is not None:
+        limits = httpx.Limits(max_keepalive_connections=1, keepalive_expiry=60)
+        try:
+            transport = httpx.HTTPTransport(http2=True, retries=RETRIES, limits=limits)
+        except ImportError:   # httpx without the h2 package
+            transport = httpx.HTTPTransport(retries=RETRIES, limits=limits)
+        return httpx.Client(transport=transport, timeout=TIMEOUT_S)
+    # Transient failures only (connect errors, 502/503/504), with exponential backoff
+    retry = Retry(total=RETRIES, backoff_factor=0.2,
+                  status_forcelist=(502, 503, 504), allowed_methods=("POST",))
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retry))
+    session.headers.update({"Connection": "keep-alive"})
+    return session
+
+_CLIENT = _make_client()
+
 def _post_gcode(script: str):
-    """POST a G-code script to Moonraker with simple retries."""
+    """POST a G-code script to Moonraker (transient errors are retried by the client)."""
     url = f"{MOONRAKER_URL}/printer/gcode/script"
-    last_err = None
-    for _ in range(1 + RETRIES):
-        try:
-            r = requests.post(url, json={"script": script}, timeout=TIMEOUT_S)
-            r.raise_for_status()
-            return
-        except Exception as e:
-            last_err = e
-            time.sleep(0.4)
-    raise RuntimeError(f"Moonraker error for '{script}': {last_err}")
+    try:
+        r = _CLIENT.post(url, json={"script": script}, timeout=TIMEOUT_S)
+        r.raise_for_status()
+    except Exception as e:
+        reset_magnet_state()   # a failed SET_FAN_SPEED leaves the real magnet state unknown
+        raise RuntimeError(f"Moonraker error for '{script}': {e}") from e
+
+def flush():
+    """Kept for callers of the old queued sender; every send is synchronous now."""
 
 def _send(cmd: str):
-    print(f"[GCODE] {cmd}")
+    _log.debug("GCODE %s", cmd)
     _post_gcode(cmd)
 
+def _send_script(lines):
+    """Send several G-code lines as one multi-line script (one POST)."""
+    if _log.isEnabledFor(logging.DEBUG):
+        for cmd in lines:
+            _log.debug("GCODE %s", cmd)
+    _post_gcode("\n".join(lines))
+
 
 # ==================== Work area / mapping ====================
 
@@ -65,40 +111,77 @@ def set_workarea(xmin: float, ymin: float, width: float, height: float):
     """Update board rectangle in mm (persist only for this process)."""
     global WORK_X_MIN, WORK_Y_MIN, WORK_W, WORK_H
     WORK_X_MIN, WORK_Y_MIN, WORK_W, WORK_H = xmin, ymin, width, height
-    print(f"[bridge] workarea = origin({xmin:.1f},{ymin:.1f}) size({width:.1f}×{height:.1f})")
+    _rebuild_square_cache()
+    _log.info("workarea = origin(%.1f,%.1f) size(%.1f×%.1f)", xmin, ymin, width, height)
+
+# 'a1'..'h8' -> square center in mm, and the matching pre-formatted
+# "X.. Y.." G-code fragment; both rebuilt whenever the work area changes.
+_SQUARE_CACHE = {}
+_GCODE_FRAG   = {}
+
+def _rebuild_square_cache():
+    sq_w = WORK_W / 8.0
+    sq_h = WORK_H / 8.0
+    _SQUARE_CACHE.clear()
+    _GCODE_FRAG.clear()
+    for file_i in range(8):
+        for rank_i in range(8):
+            name = chr(ord('a') + file_i) + str(rank_i + 1)
+            x = WORK_X_MIN + (file_i + 0.5) * sq_w
+            y = WORK_Y_MIN + (rank_i + 0.5) * sq_h
+            _SQUARE_CACHE[name] = (x, y)
+            _GCODE_FRAG[name] = f"X{x:.3f} Y{y:.3f}"
+
+_rebuild_square_cache()
+
+def _square_name(square: str) -> str:
+    """Normalize 'E2 ' -> 'e2'; raises ValueError for anything off the board."""
+    if square in _SQUARE_CACHE:
+        return square
+    name = square.strip().lower()
+    if name not in _SQUARE_CACHE:
+        raise ValueError(f"Bad square '{name}'")
+    return name
 
 def _square_center_mm(square: str) -> Tuple[float, float]:
     """
     'a1'..'h8' -> (x_mm, y_mm) at the center of the square, a1 is lower-left.
     """
-    square = square.strip().lower()
-    if len(square) != 2 or not ('a' <= square[0] <= 'h') or not ('1' <= square[1] <= '8'):
-        raise ValueError(f"Bad square '{square}'")
-    file_i = ord(square[0]) - ord('a')   # 0..7
-    rank_i = int(square[1]) - 1          # 0..7
-    sq_w = WORK_W / 8.0
-    sq_h = WORK_H / 8.0
-    x = WORK_X_MIN + (file_i + 0.5) * sq_w
-    y = WORK_Y_MIN + (rank_i + 0.5) * sq_h
-    return x, y
+    return _SQUARE_CACHE[_square_name(square)]
 
 
 # ==================== Public API ====================
 
 def home_xy():
     """Home X and Y axes (absolute mode, motors on)."""
-    _send("M17")
-    _send("G90")
-    _send("G28 X Y")
+    _send_script(["M17", "G90", "G28 X Y"])
+    reset_magnet_state()
 
 def goto_xy(x_mm: float, y_mm: float, feed: float = FEED_MOVE):
     """Rapid move to XY in ABS mode."""
     _send(f"G0 X{x_mm:.3f} Y{y_mm:.3f} F{int(feed)}")
 
+# Last magnet state sent to the printer (None = unknown, e.g. after a restart)
+_magnet_state: Optional[bool] = None
+
+def reset_magnet_state():
+    """Forget the cached magnet state so the next magnet() call always sends."""
+    global _magnet_state
+    _magnet_state = None
+
+def goto_square(square: str, feed: float = FEED_MOVE):
+    """Rapid move to a square center."""
+    _send(f"G0 {_GCODE_FRAG[_square_name(square)]} F{int(feed)}")
+
 def magnet(enable: bool):
-    """Turn magnet fan ON/OFF."""
+    """Turn magnet fan ON/OFF. No-op if already in that state."""
+    global _magnet_state
+    enable = bool(enable)
+    if enable == _magnet_state:
+        return
     spd = MAGNET_ON if enable else MAGNET_OFF
     _send(f"SET_FAN_SPEED FAN={MAGNET_FAN} SPEED={spd}")
+    _magnet_state = enable
 
 def dwell_ms(ms: int):
     _send(f"G4 P{int(ms)}")
@@ -114,17 +197,28 @@ def move_piece(src_alg: str, dst_alg: str,
       3) go to dest center
       4) magnet OFF + dwell
     """
-    x1, y1 = _square_center_mm(src_alg)
-    x2, y2 = _square_center_mm(dst_alg)
-    print(f"[bridge] move {src_alg}->{dst_alg}  ({x1:.1f},{y1:.1f})→({x2:.1f},{y2:.1f})")
-
-    goto_xy(x1, y1, feed)
-    magnet(True)
-    dwell_ms(dwell_pick_ms)
-
-    goto_xy(x2, y2, feed)
-    magnet(False)
-    dwell_ms(dwell_drop_ms)
+    global _magnet_state
+    src, dst = _square_name(src_alg), _square_name(dst_alg)
+    if _log.isEnabledFor(logging.INFO):
+        _log.info("move %s->%s  (%.1f,%.1f)→(%.1f,%.1f)", src, dst,
+                  *_SQUARE_CACHE[src], *_SQUARE_CACHE[dst])
+
+    if USE_MOVE_MACRO:
+        _send(f"CHESS_MOVE SRC={src} DST={dst} FEED={int(feed)} "
+              f"PICK={int(dwell_pick_ms)} DROP={int(dwell_drop_ms)}")
+        _magnet_state = False
+        return
+
+    f = int(feed)
+    _send_script([
+        f"G0 {_GCODE_FRAG[src]} F{f}",
+        f"SET_FAN_SPEED FAN={MAGNET_FAN} SPEED={MAGNET_ON}",
+        f"G4 P{int(dwell_pick_ms)}",
+        f"G0 {_GCODE_FRAG[dst]} F{f}",
+        f"SET_FAN_SPEED FAN={MAGNET_FAN} SPEED={MAGNET_OFF}",
+        f"G4 P{int(dwell_drop_ms)}",
+    ])
+    _magnet_state = False   # the script always ends with the magnet released
 
 
 # ==================== CLI for quick testing ====================
@@ -154,6 +248,7 @@ def _cli():
     p_mv.add_argument("dst")
 
     args = ap.parse_args()
+    logging.basicConfig(level=logging.INFO, format="[%(name)s] %(message)s")
 
     if args.cmd == "home":
         home_xy()
@@ -1,10 +1,11 @@
- import moonrakerpy as moonpy
 import chess
 import chess.pgn
 import io
-import time
+import os
+from concurrent.futures import ProcessPoolExecutor
 
 # Initialize the printer (we won't actually send G-code in this version)
+# import moonrakerpy as moonpy
 # printer = moonpy.MoonrakerPrinter("http://192.168.1.217:7125")
 
 # Define board size and square size in mm
@@ -17,34 +18,27 @@ square_size = board_size / 8  # Each square will be 350/8 mm
 def pgn_to_coordinate_notation(pgn_text):
     # Read the game from PGN text
     game = chess.pgn.read_game(io.StringIO(pgn_text))
-    board = game.board()  # Get the initial board position
-    coordinate_moves = []  # List to store move notations
 
-    # Loop through all the moves in the PGN game
-    for move in game.mainline_moves():
-        # Convert from square to notation (e.g., e2)
-        from_square = chess.square_name(move.from_square)
-        # Convert to square to notation (e.g., e4)
-        to_square = chess.square_name(move.to_square)
-        # Combine to form a move like 'e2e4'
-        coordinate_moves.append(from_square + to_square)
-        board.push(move)  # Update the board with the move
-
-    return coordinate_moves
+    # UCI already spells a move as from+to squares (e.g. 'e2e4'); drop any
+    # promotion suffix. No board replay is needed for plain coordinates.
+    return [move.uci()[:4] for move in game.mainline_moves()]
 
 # Function to convert chess notation (e.g., 'e2') to coordinates (mm)
 
 
-def chess_notation_to_coordinates(notation):
-    column = notation[0].upper()  # Get the column letter (e.g., 'e')
-    row = notation[1]  # Get the row number (e.g., '2')
+# Lookup tables for notation characters (either case for files)
+_FILE_IDX = {c: i for i, c in enumerate("abcdefgh")}
+_FILE_IDX.update({c.upper(): i for c, i in _FILE_IDX.items()})
+_RANK_IDX = {str(i + 1): i for i in range(8)}
+
 
+def chess_notation_to_coordinates(notation):
     # Calculate the x and y indexes based on the board
     # Convert column letter to index (A-H -> 0-7)
-    x_index = ord(column) - ord('A')
+    x_index = _FILE_IDX[notation[0]]
 
     # Reverse the row so that row 1 is at the bottom and row 8 is at the top
-    y_index = 8 - int(row)  # Flip the row so that row 1 is at the bottom
+    y_index = 7 - _RANK_IDX[notation[1]]  # Flip the row so that row 1 is at the bottom
 
     # Calculate x and y in millimeters, reversing the x-axis (A=350, H=0)
     x_mm = (7 - x_index) * (board_size / 7)  # Reverse the x-axis mapping
@@ -80,15 +74,15 @@ def generate_gcode(pgn_text, output_file="chess_moves.gcode"):
         gcode_commands.append(move_to_square(from_square))
         gcode_commands.append(f"; Move from {from_square}")
 
-        # Add a small delay between moves (if needed for visual effect)
-        time.sleep(0.5)
+        # Add a small delay between moves (dwell runs on the printer, not the host)
+        gcode_commands.append("G4 P500")
 
         # Add G-code to move to the 'to' square
         gcode_commands.append(move_to_square(to_square))
         gcode_commands.append(f" ; Move to {to_square}")
 
-        # Add a small delay after each move (if needed for visual effect)
-        time.sleep(0.5)
+        # Add a small delay after each move (dwell runs on the printer, not the host)
+        gcode_commands.append("G4 P500")
 
     # Add a final command to stop the printer (optional, depending on your printer)
     gcode_commands.append("M104 S0 ; Turn off extruder")
@@ -98,10 +92,28 @@ def generate_gcode(pgn_text, output_file="chess_moves.gcode"):
 
     # Write the G-code commands to the output file
     with open(output_file, "w") as file:
-        file.write("\n".join(gcode_commands))
+        file.writelines(c + "\n" for c in gcode_commands)
 
     print(f"G-code file generated: {output_file}")
 
+# Function to generate G-code for many PGN files at once. Each file is
+# independent work, so they are spread over worker processes.
+
+
+def _generate_gcode_file(job):
+    pgn_path, output_file = job
+    with open(pgn_path, encoding="utf-8") as file:
+        generate_gcode(file.read(), output_file)
+    return output_file
+
+
+def generate_gcode_many(pgn_paths, out_dir, max_workers=None):
+    os.makedirs(out_dir, exist_ok=True)
+    jobs = [(path, os.path.join(out_dir, os.path.splitext(os.path.basename(path))[0] + ".gcode"))
+            for path in pgn_paths]
+    with ProcessPoolExecutor(max_workers=max_workers) as ex:
+        return list(ex.map(_generate_gcode_file, jobs))
+
 
 # Sample PGN game (you can replace this with your actual PGN)
 pgn_sample = """
@@ -117,4 +129,5 @@ pgn_sample = """
 """
 
 # Call the function to generate G-code for the sample PGN
-generate_gcode(pgn_sample)
+if __name__ == "__main__":
+    generate_gcode(pgn_sample)
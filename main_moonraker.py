@@ -2,8 +2,15 @@ import moonrakerpy as moonpy
 import chess
 import chess.pgn
 import io
+from functools import lru_cache
 
-printer = moonpy.MoonrakerPrinter("http://192.168.1.217:7125")
+MOONRAKER_URL = "http://192.168.1.217:7125"
+
+
+@lru_cache(maxsize=None)
+def _get_printer():
+    # Connect on first use so importing this module stays free of network I/O
+    return moonpy.MoonrakerPrinter(MOONRAKER_URL)
 
 
 # class printer:
@@ -49,18 +56,18 @@ def pgn_to_movelist(pgn_text):
     board = game.board()
     move_list = MoveList()
 
+    moves = move_list.moves
     for move in game.mainline_moves():
-        from_square = chess.square_name(move.from_square)
-        to_square = chess.square_name(move.to_square)
-        is_knight = str(board.piece_at(move.from_square)).lower() == "n"
+        uci = move.uci()
+        is_knight = board.piece_type_at(move.from_square) == chess.KNIGHT
         is_capture = board.is_capture(move)
-        move_list.add_move(from_square, to_square, is_knight, is_capture)
+        moves.append(Move(uci[:2], uci[2:4], is_knight, is_capture))
         board.push(move)
 
     return move_list
 
 
-def chess_notation_to_coordinates(notation):
+def _notation_to_coordinates(notation):
     column = notation[0].upper()
     row = notation[1]
 
@@ -73,51 +80,90 @@ def chess_notation_to_coordinates(notation):
     return x_mm, y_mm
 
 
-def move_to_square(notation):
+# Board geometry is fixed, so every square's coordinates are computed once.
+SQUARE_COORDS = {f + r: _notation_to_coordinates(f + r)
+                 for f in "abcdefghABCDEFGH" for r in "12345678"}
+
+
+def chess_notation_to_coordinates(notation):
+    coords = SQUARE_COORDS.get(notation)
+    if coords is None:
+        coords = _notation_to_coordinates(notation)
+    return coords
+
+
+def square_gcode(notation):
     x_mm, y_mm = chess_notation_to_coordinates(notation)
-    printer.send_gcode(f"G0 X{x_mm} Y{y_mm}")
+    return f"G0 X{x_mm} Y{y_mm}"
+
+
+def move_to_square(notation):
+    _get_printer().send_gcode(square_gcode(notation))
+
+
+def wait_gcode(time):
+    return f'G4 P{time}'
+
+
+def heat_gcode(value):
+    return f'SET_HEATER_TEMPERATURE HEATER=extruder TARGET={value}'
 
 
 def capturePiece(fromS, toS):
-    move_to_square(fromS)
-    printerHeat(100)
-    printerWait(500)
-    move_to_square(toS)
+    _get_printer().send_gcode("\n".join([
+        square_gcode(fromS),
+        heat_gcode(100),
+        wait_gcode(500),
+        square_gcode(toS),
+    ]))
     print(fromS, toS)
 
 
 def printerWait(time):
-    printer.send_gcode(f'G4 P{time}')
+    _get_printer().send_gcode(wait_gcode(time))
 
 
 def printerHeat(value):
-    printer.send_gcode(
-        f'SET_HEATER_TEMPERATURE HEATER=extruder TARGET={value}')
+    _get_printer().send_gcode(heat_gcode(value))
 
 
 def printerPrep():
     printerHeat(0)
-    printer.send_gcode('G28 X Y')
+    _get_printer().send_gcode('G28 X Y')
+
+
+MOVES_PER_SCRIPT = 20  # moves coalesced into one multi-line send_gcode call
+
+
+def move_gcode(move):
+    lines = [
+        heat_gcode(0),
+        # if (move.is_capture):
+        #     capturePiece(move.to_square,)
+        square_gcode(move.from_square),
+        heat_gcode(100),
+        wait_gcode(2000),
+    ]
+    if move.is_knight:
+        intermediate_square = move.from_square[0] + move.to_square[1]
+        lines.append(square_gcode(intermediate_square))
+        lines.append(wait_gcode(750))
+    lines.append(square_gcode(move.to_square))
+    lines.append(wait_gcode(2000))
+    return lines
 
 
 def play_game(pgn_text):
     printerPrep()
     moves = pgn_to_movelist(pgn_text)
-    for move in moves:
-        printerHeat(0)
-        # if (move.is_capture):
-        #     capturePiece(move.to_square,)
-        move_to_square(move.from_square)
-        printerHeat(100)
-        printerWait(2000)
-        if move.is_knight:
-            intermediate_square = move.from_square[0] + move.to_square[1]
-            move_to_square(intermediate_square)
-            printerWait(750)
-        move_to_square(move.to_square)
-        printerWait(2000)
+    for start in range(0, len(moves), MOVES_PER_SCRIPT):
+        script = []
+        for move in moves.moves[start:start + MOVES_PER_SCRIPT]:
+            script.extend(move_gcode(move))
+        _get_printer().send_gcode("\n".join(script))
 
 
 pgn_sample = """
 1. d4 d5 2. c4 dxc4 3. e4 b5 4. a4 a6 5. axb5 axb5 6. Rxa8 Nf6 7. Be2 e6 8. Nf3 Bd6 9. O-O O-O"""
-play_game(pgn_sample)
+if __name__ == "__main__":
+    play_game(pgn_sample)
@@ -17,7 +17,16 @@ import chess
 
 Point = Tuple[float, float]  # (x_units, y_units)
 
+KNIGHT_OFFSETS = ((1, 2), (2, 1), (2, -1), (1, -2), (-1, -2), (-2, -1), (-2, 1), (-1, 2))
+
+# 'a1'..'h8' (either case) -> (f, r)
+_ALG_FR = {f + r: (i, j) for i, f in enumerate("abcdefgh") for j, r in enumerate("12345678")}
+_ALG_FR.update({alg.upper(): fr for alg, fr in _ALG_FR.items()})
+
 def fr_from_alg(a: str) -> Tuple[int, int]:
+    fr = _ALG_FR.get(a)
+    if fr is not None:
+        return fr
     f = ord(a[0].lower()) - ord('a')
     r = int(a[1]) - 1
     return f, r
@@ -45,13 +54,22 @@ class CaptureGraveyard:
         self.spacing = float(spacing_units)
         self.count = 0  # total captured pieces so far
 
+    @staticmethod
+    def slot_for_index(n: int, margin: float, spacing: float) -> Point:
+        """Slot position of the n-th captured piece (pure; no counter involved)."""
+        col, row = divmod(n, 8)
+        x = 8.0 + margin + 0.5 + col * 0.9  # second col nudged to the right
+        y = 0.5 + row * spacing
+        return (x, y)
+
+    def all_slots(self, n: int) -> List[Point]:
+        """Positions of the first n slots, e.g. to precompute a whole game."""
+        return [self.slot_for_index(i, self.margin, self.spacing) for i in range(n)]
+
     def next_slot(self) -> Point:
-        col = self.count // 8
-        row = self.count % 8
-        x = 8.0 + self.margin + 0.5 + col * 0.9  # second col nudged to the right
-        y = 0.5 + row * self.spacing
+        p = self.slot_for_index(self.count, self.margin, self.spacing)
         self.count += 1
-        return (x, y)
+        return p
 
 class PathFinder:
     """
@@ -65,9 +83,27 @@ class PathFinder:
         # Convert a physical margin (mm) into board units (squares)
         self.margin_units = float(margin_mm) / float(square_mm)
         self.graveyard = CaptureGraveyard(self.margin_units)
+        # Every legal knight hop (<= 336 of them) resolved once; paths are shared tuples.
+        self._knight_cache = {}
+        for f in range(8):
+            for r in range(8):
+                for df, dr in KNIGHT_OFFSETS:
+                    tf, tr = f + df, r + dr
+                    if 0 <= tf < 8 and 0 <= tr < 8:
+                        self._knight_cache[((f, r), (tf, tr))] = tuple(
+                            self._knight_path((f, r), (tf, tr)))
+        # piece_type -> path handler; anything missing moves straight/diagonal
+        self._dispatch = {chess.KNIGHT: self.path_knight_units}
 
     # ---------------- KNIGHT ----------------
-    def path_knight_units(self, fr_from: Tuple[int,int], fr_to: Tuple[int,int]) -> List[Point]:
+    def path_knight_units(self, fr_from: Tuple[int,int], fr_to: Tuple[int,int]) -> Tuple[Point, ...]:
+        path = self._knight_cache.get((tuple(fr_from), tuple(fr_to)))
+        if path is None:
+            path = tuple(self._knight_path(fr_from, fr_to))
+        return path
+
+    @staticmethod
+    def _knight_path(fr_from: Tuple[int,int], fr_to: Tuple[int,int]) -> List[Point]:
         (fx, fy) = fr_from
         (tx, ty) = fr_to
         sx, sy = center_of(fr_from)
@@ -118,13 +154,10 @@ class PathFinder:
         pts: List[Point] = [(sx, sy)]
         x0 = fr_from[0]
         x1 = fr_to[0]
-        # Go corridor-by-corridor (between files) until near dst, then center.
-        c = min(x0, x1) + 1 if step > 0 else max(x0, x1)
-        while True:
-            pts.append(corridor_to_x(float(c), sy))
-            if (step > 0 and c >= x1) or (step < 0 and c <= x1):
-                break
-            c += step
+        # Go corridor-by-corridor (between files) up to the dst file line, then center.
+        start = min(x0, x1) + 1 if step > 0 else max(x0, x1)
+        stop = x1 + step
+        pts.extend(corridor_to_x(float(c), sy) for c in range(start, stop, step))
         pts.append((dx, dy))
         return pts
 
@@ -161,11 +194,10 @@ class PathFinder:
                             fr_to: Tuple[int,int],
                             is_capture: bool,
                             is_castling: bool) -> List[Point]:
-        # Knights always use corridors
-        if piece_type == chess.KNIGHT:
-            return self.path_knight_units(fr_from, fr_to)
         # King castling: corridor path
-        if piece_type == chess.KING and is_castling:
+        if is_castling and piece_type == chess.KING:
             return self.path_king_castle_units(fr_from, fr_to)
-        # Otherwise straight/diag is fine (board guarantees line is clear)
-        return self.path_direct_units(fr_from, fr_to)
+        # Knights always use corridors; otherwise straight/diag is fine
+        # (board guarantees line is clear)
+        handler = self._dispatch.get(piece_type, self.path_direct_units)
+        return list(handler(fr_from, fr_to))
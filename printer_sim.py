@@ -31,6 +31,7 @@ import sys
 import pygame
 import chess
 import heapq
+from functools import lru_cache
 
 # ------------------ Window & Board Geometry ------------------
 INCH_PX = 96  # exact 1-inch sidebar
@@ -67,12 +68,10 @@ FILES = "abcdefgh"
 
 # ------------------ Chess / Mapping Helpers ------------------
 def sq_to_rc(square: chess.Square):
-    f = chess.square_file(square)  # 0..7
-    r = chess.square_rank(square)  # 0..7
-    return (r, f)
+    return (square >> 3, square & 7)  # (rank, file), both 0..7
 
 def rc_to_sq(r, c):
-    return chess.square(c, r)
+    return (r << 3) | c
 
 def rc_to_center_xy(r, c):
     cx = MARGIN + c * SQUARE + SQUARE / 2
@@ -90,13 +89,6 @@ def mouse_to_square(mx, my):
         return rc_to_sq(r, c)
     return None
 
-def board_occupied_rc(board: chess.Board):
-    occ = set()
-    for sq in chess.SQUARES:
-        if board.piece_at(sq):
-            occ.add(sq_to_rc(sq))
-    return occ
-
 # Safe en passant detector (no reliance on board.is_en_passant)
 def is_en_passant(board: chess.Board, move: chess.Move) -> bool:
     p = board.piece_at(move.from_square)
@@ -143,11 +135,12 @@ def build_corridor_graph():
             link(n, ("C", r, c))
             link(n, ("C", r+1, c))
 
-    return nodes, edges
+    # graph is static from here on: freeze adjacency into sorted tuples
+    return nodes, {n: tuple(sorted(adj)) for n, adj in edges.items()}
 
 NODES, EDGES = build_corridor_graph()
 
-def node_xy(node):
+def _node_xy_calc(node):
     t, r, c = node
     if t == "C":
         return rc_to_center_xy(r, c)
@@ -160,104 +153,176 @@ def node_xy(node):
         x2, y2 = rc_to_center_xy(r+1, c)
         return ((x1 + x2) / 2, (y1 + y2) / 2)
 
+# Node coordinates, computed once. NODE_LIST has a stable (sorted) order so
+# nearest-node ties resolve the same way on every run.
+NODE_LIST = tuple(sorted(NODES))
+NODE_XY   = {n: _node_xy_calc(n) for n in NODE_LIST}
+
+# Dense integer ids (index into NODE_LIST) for the A* inner loop. NODE_NBRS[i]
+# holds neighbour ids; NODE_CENTER_BIT[i] is the square's bitboard bit for a
+# square-center node and 0 for midpoints, so blocking is a single AND.
+NODE_ID         = {n: i for i, n in enumerate(NODE_LIST)}
+NODE_NBRS       = tuple(tuple(NODE_ID[m] for m in EDGES[n]) for n in NODE_LIST)
+NODE_CENTER_BIT = tuple(1 << ((r << 3) | c) if t == "C" else 0 for t, r, c in NODE_LIST)
+
+def node_xy(node):
+    return NODE_XY[node]
+
+# Integer half-square coordinates (row counted from the top, as on screen):
+# centers sit on even/even, "H" midpoints on an odd column, "V" on an odd row.
+NODE_HR = tuple(2 * (7 - r) - (t == "V") for t, r, c in NODE_LIST)
+NODE_HC = tuple(2 * c + (t == "H") for t, r, c in NODE_LIST)
+
+# Nodes sit on a half-square lattice measured from the a8 center:
+# even/even = square center, odd x = "H" midpoint, odd y = "V" midpoint
+# (odd/odd corners are not nodes).
+HALF_SQ = SQUARE / 2
+LATTICE_N = 15  # lattice points per axis (8 centers + 7 midpoints)
+LATTICE = {}
+for _n in NODE_LIST:
+    _x, _y = NODE_XY[_n]
+    LATTICE[(round((_x - MARGIN - HALF_SQ) / HALF_SQ), round((_y - MARGIN - HALF_SQ) / HALF_SQ))] = _n
+del _n, _x, _y
+
 def nearest_node_to_xy(xy):
+    """
+    Closest corridor node (Manhattan). Only the lattice cells around xy are
+    checked; ties go to the smallest node, matching a scan in NODE_LIST order.
+    """
+    x, y = xy
+    ix = min(max(int((x - MARGIN - HALF_SQ) // HALF_SQ), 0), LATTICE_N - 1)
+    iy = min(max(int((y - MARGIN - HALF_SQ) // HALF_SQ), 0), LATTICE_N - 1)
     best = None
-    bestd = 1e18
-    for n in NODES:
-        nx, ny = node_xy(n)
-        d = abs(nx - xy[0]) + abs(ny - xy[1])
-        if d < bestd:
-            bestd = d
-            best = n
-    return best
+    for jx in range(ix - 1, ix + 3):
+        for jy in range(iy - 1, iy + 3):
+            n = LATTICE.get((jx, jy))
+            if n is None:
+                continue
+            nx, ny = NODE_XY[n]
+            cand = (abs(nx - x) + abs(ny - y), n)
+            if best is None or cand < best:
+                best = cand
+    return best[1]
 
 def heuristic(a, b):
-    ax, ay = node_xy(a); bx, by = node_xy(b)
-    return abs(ax - bx) + abs(ay - by)
-
-def a_star(start, goal, is_blocked_center):
-    openh = []
-    heapq.heappush(openh, (0, start))
-    came = {start: None}
-    g = {start: 0}
-
-    while openh:
-        _, cur = heapq.heappop(openh)
-        if cur == goal:
+    a, b = NODE_ID[a], NODE_ID[b]
+    return (abs(NODE_HR[a] - NODE_HR[b]) + abs(NODE_HC[a] - NODE_HC[b])) * (SQUARE // 2)
+
+@lru_cache(maxsize=None)
+def _h_table(goal_id):
+    """Pixel-scale Manhattan distance from every node to goal_id, as ints."""
+    gr, gc, k = NODE_HR[goal_id], NODE_HC[goal_id], SQUARE // 2
+    return tuple((abs(hr - gr) + abs(hc - gc)) * k for hr, hc in zip(NODE_HR, NODE_HC))
+
+def a_star(start, goal, blocked_bb):
+    """
+    A* over integer node ids; takes and returns node tuples. blocked_bb is a
+    bitboard of square centers that may not be entered (the goal always may).
+    """
+    s_id, goal_id = NODE_ID[start], NODE_ID[goal]
+    n_nodes = len(NODE_LIST)
+    g = [1e18] * n_nodes
+    came = [-1] * n_nodes
+    g[s_id] = 0
+    h = _h_table(goal_id)
+    # Bucket queue: f is a small int, so open nodes are grouped per f value
+    # (each bucket a heap of ids) and only the distinct f values are heap-
+    # ordered. Pops come out in the same (f, id) order as a heap of tuples.
+    buckets = {0: [s_id]}
+    fkeys = [0]
+    heappush, heappop = heapq.heappush, heapq.heappop
+
+    while fkeys:
+        f_pop = fkeys[0]
+        b = buckets[f_pop]
+        cur = heappop(b)
+        if not b:
+            heappop(fkeys)
+            del buckets[f_pop]
+        # lazy deletion: skip entries superseded by a cheaper push of the same node
+        if f_pop > g[cur] + h[cur] and cur != s_id:
+            continue
+        if cur == goal_id:
             path = []
             n = cur
-            while n is not None:
-                path.append(n)
+            while n != -1:
+                path.append(NODE_LIST[n])
                 n = came[n]
             path.reverse()
             return path
-        for nb in EDGES[cur]:
-            if nb[0] == "C":
-                rr, cc = nb[1], nb[2]
-                if is_blocked_center(rr, cc) and nb != goal:
-                    continue
+        for nb in NODE_NBRS[cur]:
+            if blocked_bb & NODE_CENTER_BIT[nb] and nb != goal_id:
+                continue
             t = g[cur] + 1
-            if t < g.get(nb, 1e18):
+            if t < g[nb]:
                 g[nb] = t
                 came[nb] = cur
-                f = t + heuristic(nb, goal)
-                heapq.heappush(openh, (f, nb))
+                f = t + h[nb]
+                b = buckets.get(f)
+                if b is None:
+                    buckets[f] = [nb]
+                    heappush(fkeys, f)
+                else:
+                    heappush(b, nb)
     return None
 
-def plan_corridor_path(board: chess.Board, src_sq: chess.Square, dst_sq: chess.Square):
-    occ = board_occupied_rc(board)
-    rs, cs = sq_to_rc(src_sq)
-    rd, cd = sq_to_rc(dst_sq)
-    start = ("C", rs, cs)
-    goal  = ("C", rd, cd)
+# Planners take occupancy as a python-chess style bitboard (default: board.occupied)
+# so callers can plan against a hypothetical position without copying the board.
+def plan_corridor_path(board: chess.Board, src_sq: chess.Square, dst_sq: chess.Square, occ=None):
+    if occ is None:
+        occ = board.occupied
+    start = ("C", src_sq >> 3, src_sq & 7)
+    goal  = ("C", dst_sq >> 3, dst_sq & 7)
 
-    def blocked(r, c):
-        return (r, c) in occ and not (r == rs and c == cs)
-
-    nodes = a_star(start, goal, blocked)
+    nodes = a_star(start, goal, occ & ~(1 << src_sq))
     if not nodes:
         raise RuntimeError("No corridor path found.")
     return [node_xy(n) for n in nodes]
 
-def corridor_between_points(board: chess.Board, xy_start, xy_end):
-    occ = board_occupied_rc(board)
+def corridor_between_points(board: chess.Board, xy_start, xy_end, occ=None):
+    if occ is None:
+        occ = board.occupied
     start = nearest_node_to_xy(xy_start)
     goal  = nearest_node_to_xy(xy_end)
 
     # It's possible that the nearest node to either endpoint is the center of
     # an occupied square (for example, when starting outside the board near a
     # piece).  We still need to allow entering/exiting through that square, so
-    # exempt those centers from the blocked set.
-    exempt = set()
-    if start[0] == "C":
-        exempt.add((start[1], start[2]))
-    if goal[0] == "C":
-        exempt.add((goal[1], goal[2]))
-
-    def blocked(r, c):
-        return (r, c) in occ and (r, c) not in exempt
+    # exempt those centers from the blocked mask.
+    exempt = NODE_CENTER_BIT[NODE_ID[start]] | NODE_CENTER_BIT[NODE_ID[goal]]
 
-    nodes = a_star(start, goal, blocked)
+    nodes = a_star(start, goal, occ & ~exempt)
     if not nodes:
         raise RuntimeError("No path between points.")
     return [node_xy(n) for n in nodes]
 
-def corridor_to_point(board: chess.Board, from_sq: chess.Square, xy_end):
-    rs, cs = sq_to_rc(from_sq)
-    start = ("C", rs, cs)
+def corridor_to_point(board: chess.Board, from_sq: chess.Square, xy_end, occ=None):
+    start = ("C", from_sq >> 3, from_sq & 7)
     goal  = nearest_node_to_xy(xy_end)
-    occ = board_occupied_rc(board)
+    if occ is None:
+        occ = board.occupied
 
-    def blocked(r, c):
-        return (r, c) in occ and not (r == rs and c == cs)
-
-    nodes = a_star(start, goal, blocked)
+    nodes = a_star(start, goal, occ & ~(1 << from_sq))
     if not nodes:
         raise RuntimeError("No path to point.")
     return [node_xy(n) for n in nodes]
 
 # ------------------ Special Knight Route (on lines) ------------------
-def plan_knight_route_on_lines(board: chess.Board, move: chess.Move):
+def _knight_template(dr, dc):
+    """Pixel offsets (from the source center) of the two lane waypoints."""
+    half = SQUARE * 0.5
+    two  = SQUARE * 2.0
+    dir_x = 1 if dc > 0 else -1
+    dir_y = -1 if dr > 0 else 1  # screen Y down is +
+    if abs(dr) == 2:  # vertical long leg
+        return (dir_x * half, 0.0, dir_x * half, dir_y * two)
+    return (0.0, dir_y * half, dir_x * two, dir_y * half)  # horizontal long leg
+
+KNIGHT_TEMPLATES = {(dr, dc): _knight_template(dr, dc)
+                    for dr, dc in ((2, 1), (2, -1), (-2, 1), (-2, -1),
+                                   (1, 2), (1, -2), (-1, 2), (-1, -2))}
+
+def plan_knight_route_on_lines(board: chess.Board, move: chess.Move, occ=None):
     """
     Knight path that stays on corridors:
       1) 1/2-square sidestep to nearest corridor (small leg direction),
@@ -265,32 +330,14 @@ def plan_knight_route_on_lines(board: chess.Board, move: chess.Move):
       3) 1/2-square into destination center.
     """
     src, dst = move.from_square, move.to_square
-    r0, c0 = sq_to_rc(src); r1, c1 = sq_to_rc(dst)
-    dr = r1 - r0; dc = c1 - c0
+    r0, c0 = src >> 3, src & 7
+    r1, c1 = dst >> 3, dst & 7
+    tpl = KNIGHT_TEMPLATES.get((r1 - r0, c1 - c0))
+    if tpl is None:
+        return plan_corridor_path(board, src, dst, occ=occ)
     x0, y0 = rc_to_center_xy(r0, c0)
-    x1, y1 = rc_to_center_xy(r1, c1)
-
-    half = SQUARE * 0.5
-    two  = SQUARE * 2.0
-    pts = []
-
-    if abs(dr) == 2 and abs(dc) == 1:  # vertical long leg
-        dir_x = 1 if dc > 0 else -1
-        lane_x = x0 + dir_x * half
-        pts += [(x0, y0), (lane_x, y0)]
-        dir_y = -1 if dr > 0 else 1  # screen Y down is +
-        pts += [(lane_x, y0 + dir_y * two), (x1, y1)]
-        return pts
-
-    if abs(dr) == 1 and abs(dc) == 2:  # horizontal long leg
-        dir_y = -1 if dr > 0 else 1
-        lane_y = y0 + dir_y * half
-        pts += [(x0, y0), (x0, lane_y)]
-        dir_x = 1 if dc > 0 else -1
-        pts += [(x0 + dir_x * two, lane_y), (x1, y1)]
-        return pts
-
-    return plan_corridor_path(board, src, dst)
+    ax, ay, bx, by = tpl
+    return [(x0, y0), (x0 + ax, y0 + ay), (x0 + bx, y0 + by), rc_to_center_xy(r1, c1)]
 
 # ------------------ Capture: Margin/Perimeter Route ------------------
 def plan_margin_escape_path(cap_xy, grave_xy):
@@ -306,75 +353,72 @@ def plan_margin_escape_path(cap_xy, grave_xy):
     x_right  = BOARD_PIXELS - MARGIN
     y_top    = MARGIN
     y_bottom = BOARD_PIXELS - MARGIN
+    gx, gy = grave_xy
+    outside = SQUARE * 0.6
+    half = SQUARE * 0.5
 
-    d_left   = abs(cx - x_left)
-    d_right  = abs(x_right - cx)
-    d_top    = abs(cy - y_top)
-    d_bottom = abs(y_bottom - cy)
+    # nearest edge; ties resolve left, right, top, bottom
+    d_x = min(cx - x_left, x_right - cx)
+    d_y = min(cy - y_top, y_bottom - cy)
 
-    edge = min(
-        [("left", d_left), ("right", d_right), ("top", d_top), ("bottom", d_bottom)],
-        key=lambda t: t[1]
-    )[0]
+    if d_x <= d_y:
+        dir_x = -1 if cx - x_left <= x_right - cx else 1
+        border_x = x_left if dir_x < 0 else x_right
+        return [(cx, cy), (cx + dir_x * half, cy), (border_x + dir_x * outside, cy),
+                (gx, cy), (gx, gy)]
 
-    outside = SQUARE * 0.6
-    pts = [(cx, cy)]
-
-    if edge in ("left", "right"):
-        dir_x = -1 if edge == "left" else 1
-        lane_x = cx + dir_x * (SQUARE * 0.5)
-        pts.append((lane_x, cy))
-        border_x = x_left if edge == "left" else x_right
-        outside_x = border_x + dir_x * outside
-        pts.append((outside_x, cy))
-        gx, gy = grave_xy
-        pts.append((gx, cy))
-        pts.append((gx, gy))
-    else:
-        dir_y = -1 if edge == "top" else 1
-        lane_y = cy + dir_y * (SQUARE * 0.5)
-        pts.append((cx, lane_y))
-        border_y = y_top if edge == "top" else y_bottom
-        outside_y = border_y + dir_y * outside
-        pts.append((cx, outside_y))
-        gx, gy = grave_xy
-        pts.append((cx, gy))
-        pts.append((gx, gy))
-
-    return pts
+    dir_y = -1 if cy - y_top <= y_bottom - cy else 1
+    border_y = y_top if dir_y < 0 else y_bottom
+    return [(cx, cy), (cx, cy + dir_y * half), (cx, border_y + dir_y * outside),
+            (cx, gy), (gx, gy)]
 
 # ------------------ Move Planning: normal / capture / castling ------------------
 GRAVE_COLS = 2
-grave_positions = []
+def _grave_positions_calc():
+    col_w = SIDEBAR_W / GRAVE_COLS
+    x0 = BOARD_PIXELS
+    y0 = MARGIN
+    return tuple((x0 + c * col_w + col_w / 2, y0 + r * (SQUARE * 0.9) + SQUARE * 0.45)
+                 for r in range(10) for c in range(GRAVE_COLS))
+
+# Graveyard slots are fixed by the layout, so they are computed once.
+GRAVE_XY = _grave_positions_calc()
 captured_white = []
 captured_black = []
 
 def init_grave_positions():
-    global grave_positions
-    grave_positions = []
-    col_w = SIDEBAR_W / GRAVE_COLS
-    x0 = BOARD_PIXELS
-    y0 = MARGIN
-    for r in range(10):
-        for c in range(GRAVE_COLS):
-            cx = x0 + c * col_w + col_w / 2
-            cy = y0 + r * (SQUARE * 0.9) + SQUARE * 0.45
-            grave_positions.append((cx, cy))
+    """Empty the graveyard; slot positions themselves are static (GRAVE_XY)."""
+    captured_white.clear()
+    captured_black.clear()
 
 def next_grave_xy(color: chess.Color):
-    arr = captured_white if color == chess.WHITE else captured_black
-    idx = len(arr)
-    if idx < len(grave_positions):
-        return grave_positions[idx]
+    idx = len(captured_white if color == chess.WHITE else captured_black)
+    if idx < len(GRAVE_XY):
+        return GRAVE_XY[idx]
     return (BOARD_PIXELS + SIDEBAR_W/2, WIN_H - INPUT_H - 20 - idx * 10)
 
+def _coalesce(segments):
+    """
+    Merge consecutive segments with the same magnet state into one polyline,
+    dropping the repeated point where one ends and the next begins.
+    """
+    out = []
+    for seg in segments:
+        if out and out[-1]["magnet_on"] == seg["magnet_on"]:
+            prev, wps = out[-1]["waypoints"], seg["waypoints"]
+            if prev and wps and wps[0] == prev[-1]:
+                wps = wps[1:]
+            out[-1] = {"waypoints": prev + list(wps), "magnet_on": seg["magnet_on"]}
+        else:
+            out.append(seg)
+    return out
+
 def plan_capture_sequence(board: chess.Board, move: chess.Move):
     """
     Remove enemy first via margin/perimeter, then move own piece.
     Returns (segments, captured_color, grave_xy).
     """
     src, dst = move.from_square, move.to_square
-    temp = board.copy()
 
     # Determine captured square (safe en passant handling)
     if is_en_passant(board, move):
@@ -386,33 +430,36 @@ def plan_capture_sequence(board: chess.Board, move: chess.Move):
     captured_piece = board.piece_at(cap_sq)
     captured_color = captured_piece.color if captured_piece else chess.WHITE
 
+    # occupancy before and after the captured piece is lifted off
+    occ_before = board.occupied
+    occ_after = occ_before & ~(1 << cap_sq)
+
     # to target (OFF), grab (ON)
-    path_to_target = plan_corridor_path(board, src, cap_sq)
+    path_to_target = plan_corridor_path(board, src, cap_sq, occ=occ_before)
     if not path_to_target:
         raise RuntimeError("No path to captured piece.")
     cap_xy = rc_to_center_xy(*sq_to_rc(cap_sq))
     grave_xy = next_grave_xy(captured_color)
 
-    # remove captured from temp BEFORE planning own path
-    temp.remove_piece_at(cap_sq)
-
     # margin/perimeter for the captured piece
     margin_path = plan_margin_escape_path(cap_xy, grave_xy)
     if not margin_path:
         margin_path = [cap_xy, grave_xy]  # extreme fallback (shouldn't happen)
 
-    # back to src (OFF)
+    # back to src (OFF). Not a retrace of margin_path: graves fill top-down in
+    # the sidebar, so re-entering at the nearest board node to the grave is
+    # usually far shorter than going back out along the capture row.
     src_xy = rc_to_center_xy(*sq_to_rc(src))
-    path_back = corridor_between_points(temp, grave_xy, src_xy)
+    path_back = corridor_between_points(board, grave_xy, src_xy, occ=occ_after)
 
     # move own piece
     piece = board.piece_at(src)
     if piece and piece.piece_type == chess.KNIGHT:
-        path_src_to_dst = plan_knight_route_on_lines(temp, move)
+        path_src_to_dst = plan_knight_route_on_lines(board, move, occ=occ_after)
     else:
-        path_src_to_dst = plan_corridor_path(temp, src, dst)
+        path_src_to_dst = plan_corridor_path(board, src, dst, occ=occ_after)
 
-    segments = [
+    segments = _coalesce([
         {"waypoints": path_to_target, "magnet_on": False},
         {"waypoints": [path_to_target[-1]], "magnet_on": True},
         {"waypoints": margin_path, "magnet_on": True},
@@ -420,7 +467,7 @@ def plan_capture_sequence(board: chess.Board, move: chess.Move):
         {"waypoints": path_back, "magnet_on": False},
         {"waypoints": path_src_to_dst, "magnet_on": True},
         {"waypoints": [path_src_to_dst[-1]], "magnet_on": False},
-    ]
+    ])
     return segments, captured_color, grave_xy
 
 def plan_normal_move(board: chess.Board, move: chess.Move):
@@ -446,17 +493,18 @@ def plan_castling(board: chess.Board, move: chess.Move):
         rook_from = chess.square(chess.FILE_NAMES.index('a'), king_rank)
         rook_to   = chess.square(chess.FILE_NAMES.index('d'), king_rank)
 
-    rook_path = plan_corridor_path(board, rook_from, rook_to)
-    tmp = board.copy()
-    tmp.push(chess.Move(rook_from, rook_to))
-    king_path = plan_corridor_path(tmp, src, dst)
+    occ = board.occupied
+    rook_path = plan_corridor_path(board, rook_from, rook_to, occ=occ)
+    # king plans against the board with the rook already moved
+    occ_after_rook = (occ & ~(1 << rook_from)) | (1 << rook_to)
+    king_path = plan_corridor_path(board, src, dst, occ=occ_after_rook)
 
-    return [
+    return _coalesce([
         {"waypoints": rook_path, "magnet_on": True},
         {"waypoints": [rook_path[-1]], "magnet_on": False},
         {"waypoints": king_path, "magnet_on": True},
         {"waypoints": [king_path[-1]], "magnet_on": False},
-    ]
+    ])
 
 # ------------------ Rendering ------------------
 def draw_board(surface):
@@ -499,40 +547,76 @@ PIECE_CHARS = {
     chess.KING:   {True: "♔", False: "♚"},
 }
 
-def draw_pieces(surface, board, font_piece, skip_sq=None, dragging_glyph=None, drag_pos=None):
-    for sq in chess.SQUARES:
-        if skip_sq is not None and sq == skip_sq:
-            continue
+PIECE_SURF = {}  # (piece_type, color) -> (glyph surface, half width, half height)
+
+def build_piece_atlas(font_piece):
+    PIECE_SURF.clear()
+    for pt, chars in PIECE_CHARS.items():
+        for color, glyph in chars.items():
+            surf = font_piece.render(glyph, True, (15,15,15)).convert_alpha()
+            PIECE_SURF[(pt, color)] = (surf, surf.get_width() / 2, surf.get_height() / 2)
+
+def draw_pieces(surface, board, skip_sq=None, dragging_glyph=None, drag_pos=None):
+    blit = surface.blit
+    bb = board.occupied
+    if skip_sq is not None:
+        bb &= ~(1 << skip_sq)
+    while bb:
+        sq = (bb & -bb).bit_length() - 1
+        bb &= bb - 1
         piece = board.piece_at(sq)
-        if not piece: continue
-        r, c = sq_to_rc(sq)
-        cx, cy = rc_to_center_xy(r, c)
-        glyph = PIECE_CHARS[piece.piece_type][piece.color]
-        surf  = font_piece.render(glyph, True, (15,15,15))
-        surface.blit(surf, (cx - surf.get_width()/2, cy - surf.get_height()/2))
+        cx, cy = rc_to_center_xy(sq >> 3, sq & 7)
+        surf, hw, hh = PIECE_SURF[(piece.piece_type, piece.color)]
+        blit(surf, (cx - hw, cy - hh))
     # draw dragging piece on top
     if dragging_glyph and drag_pos:
-        surf = dragging_glyph
-        surface.blit(surf, (drag_pos[0] - surf.get_width()/2, drag_pos[1] - surf.get_height()/2))
+        surf, hw, hh = dragging_glyph
+        blit(surf, (drag_pos[0] - hw, drag_pos[1] - hh))
 
-def draw_graveyard(surface, font_small):
+def draw_graveyard_header(surface, font_small):
     header = font_small.render("Captured", True, COL_TEXT)
     surface.blit(header, (BOARD_PIXELS + (SIDEBAR_W - header.get_width())//2, 8))
+
+def build_background(font_small):
+    # Board, labels and graveyard header never change; paint them once and blit per frame.
+    bg = pygame.Surface((WIN_W, WIN_H)).convert()
+    draw_board(bg)
+    draw_labels(bg, font_small)
+    draw_graveyard_header(bg, font_small)
+    return bg
+
+GRAVE_DOT = {}  # color -> (dot surface, half width, half height)
+
+def build_grave_dots(font_small):
+    for color in (True, False):
+        surf = font_small.render("●", True, (220,220,220) if color else (80,80,80))
+        GRAVE_DOT[color] = (surf, surf.get_width() / 2, surf.get_height() / 2)
+
+def draw_graveyard(surface):
+    blit = surface.blit
     for arr, color in ((captured_white, True), (captured_black, False)):
+        surf, hw, hh = GRAVE_DOT[color]
         for (x, y) in arr:
-            surf = font_small.render("●", True, (220,220,220) if color else (80,80,80))
-            surface.blit(surf, (x - surf.get_width()/2, y - surf.get_height()/2))
+            blit(surf, (x - hw, y - hh))
+
+_TEXT_SURF = {}  # slot -> (text, surface); a slot re-renders only when its text changes
+
+def _cached_text(slot, font, text, color):
+    hit = _TEXT_SURF.get(slot)
+    if hit is None or hit[0] != text:
+        hit = _TEXT_SURF[slot] = (text, font.render(text, True, color))
+    return hit[1]
 
 def draw_input_bar(surface, font_ui, text, error_msg=""):
     rect = pygame.Rect(0, BOARD_PIXELS, WIN_W, INPUT_H)
     pygame.draw.rect(surface, COL_INPUT, rect)
     pygame.draw.line(surface, COL_BORDER, (0, BOARD_PIXELS), (WIN_W, BOARD_PIXELS), 2)
-    prompt = font_ui.render("Type UCI (or drag pieces):", True, COL_TEXT)
+    prompt = _cached_text("prompt", font_ui, "Type UCI (or drag pieces):", COL_TEXT)
     surface.blit(prompt, (10, BOARD_PIXELS + 10))
-    inp = font_ui.render(text, True, COL_TEXT)
+    inp = _cached_text("input", font_ui, text, COL_TEXT)
     surface.blit(inp, (10, BOARD_PIXELS + 28))
     if error_msg:
-        err = font_ui.render(error_msg, True, COL_RED)
+        err = _cached_text("error", font_ui, error_msg, COL_RED)
         surface.blit(err, (WIN_W - err.get_width() - 10, BOARD_PIXELS + 10))
 
 def draw_path(surface, points):
@@ -581,6 +665,7 @@ class Animator:
 
         seg = self.segments[self.cur_seg_i]
         wps = seg["waypoints"]
+        magnet_on = seg["magnet_on"]
         if not wps:
             self._advance_segment()
             return self.last_draw_path
@@ -588,36 +673,49 @@ class Animator:
         if self.pos is None:
             self.pos = wps[0]
 
-        speed = DRAG_SPEED_PX if seg["magnet_on"] else TRAVEL_SPEED_PX
-
         target = wps[self.cur_wp_i]
-        dx = target[0] - self.pos[0]
-        dy = target[1] - self.pos[1]
-        dist = math.hypot(dx, dy)
-
-        if dist < 1e-3:
-            if seg["magnet_on"]:
-                self.last_draw_path.append((target[0], target[1]))
+        px, py = self.pos
+        dx = target[0] - px
+        dy = target[1] - py
+        d2 = dx * dx + dy * dy
+
+        if d2 < 1e-6:
+            if magnet_on:
+                self._append_path_point(target[0], target[1])
             self.cur_wp_i += 1
             if self.cur_wp_i >= len(wps):
                 self._advance_segment()
             return self.last_draw_path
 
-        step = min(speed, dist)
-        nx = self.pos[0] + (dx / (dist + 1e-9)) * step
-        ny = self.pos[1] + (dy / (dist + 1e-9)) * step
+        speed = DRAG_SPEED_PX if magnet_on else TRAVEL_SPEED_PX
+        if d2 <= speed * speed:
+            # within one step: land exactly on the waypoint
+            nx, ny = target[0], target[1]
+        else:
+            inv = speed / math.sqrt(d2)
+            nx = px + dx * inv
+            ny = py + dy * inv
         self.pos = (nx, ny)
 
-        if seg["magnet_on"]:
-            if not self.last_draw_path:
-                self.last_draw_path.append((nx, ny))
-            else:
-                lastx, lasty = self.last_draw_path[-1]
-                if abs(nx - lastx) + abs(ny - lasty) > 0.5:
-                    self.last_draw_path.append((nx, ny))
+        if magnet_on:
+            self._append_path_point(nx, ny)
 
         return self.last_draw_path
 
+    def _append_path_point(self, x, y):
+        # Integer points; a point continuing straight on from the previous two just extends the last vertex.
+        pts = self.last_draw_path
+        p = (int(round(x)), int(round(y)))
+        if pts and pts[-1] == p:
+            return
+        if len(pts) >= 2:
+            (ax, ay), (bx, by) = pts[-2], pts[-1]
+            dx1, dy1, dx2, dy2 = bx - ax, by - ay, p[0] - bx, p[1] - by
+            if dx1 * dy2 - dy1 * dx2 == 0 and dx1 * dx2 + dy1 * dy2 > 0:
+                pts[-1] = p
+                return
+        pts.append(p)
+
     def _advance_segment(self):
         self.cur_seg_i += 1
         self.cur_wp_i = 0
@@ -634,6 +732,9 @@ def main():
     font_piece = pygame.font.SysFont("DejaVu Sans", int(SQUARE * 0.82))
     font_small = pygame.font.SysFont("DejaVu Sans", 16)
     font_ui    = pygame.font.SysFont("DejaVu Sans", 18)
+    build_piece_atlas(font_piece)
+    build_grave_dots(font_small)
+    bg = build_background(font_small)
 
     clock = pygame.time.Clock()
 
@@ -672,8 +773,7 @@ def main():
                         dragging = True
                         drag_sq = sq
                         selected_sq = sq
-                        glyph = PIECE_CHARS[piece.piece_type][piece.color]
-                        drag_glyph = font_piece.render(glyph, True, (15,15,15))
+                        drag_glyph = PIECE_SURF[(piece.piece_type, piece.color)]
                         drag_pos = (mx, my)
 
             elif ev.type == pygame.MOUSEBUTTONUP and ev.button == 1:
@@ -775,19 +875,16 @@ def main():
         magnet_pos = animator.pos if animator.pos else (MARGIN, BOARD_PIXELS - MARGIN)
 
         # draw
-        screen.fill(COL_BG)
-        draw_board(screen)
-        draw_labels(screen, pygame.font.SysFont("DejaVu Sans", 16))
+        screen.blit(bg, (0, 0))
         if selected_sq is not None:
             draw_selection(screen, selected_sq)
         skip = drag_sq if dragging else None
-        draw_pieces(screen, board, pygame.font.SysFont("DejaVu Sans", int(SQUARE * 0.82)),
-                    skip_sq=skip, dragging_glyph=(drag_glyph if dragging else None),
+        draw_pieces(screen, board, skip_sq=skip, dragging_glyph=(drag_glyph if dragging else None),
                     drag_pos=(drag_pos if dragging else None))
-        draw_graveyard(screen, pygame.font.SysFont("DejaVu Sans", 16))
+        draw_graveyard(screen)
         draw_path(screen, current_path_points)
         draw_magnet(screen, magnet_pos, magnet_on)
-        draw_input_bar(screen, pygame.font.SysFont("DejaVu Sans", 18), input_text, error_msg)
+        draw_input_bar(screen, font_ui, input_text, error_msg)
 
         pygame.display.flip()
 
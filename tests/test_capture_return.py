@@ -48,7 +48,10 @@ def test_capture_return_path_can_enter_occupied_origin():
     assert captured_color == chess.BLACK
     assert grave_xy is not None
 
-    path_back = segments[4]["waypoints"]
+    # same-magnet stubs are merged: approach, carry off, return, move, release
+    assert [seg["magnet_on"] for seg in segments] == [False, True, False, True, False]
+
+    path_back = segments[2]["waypoints"]
     src_center = rc_to_center_xy(*sq_to_rc(move.from_square))
     assert path_back[-1] == pytest.approx(src_center)
     # The path should include at least two distinct waypoints (graveyard -> board).
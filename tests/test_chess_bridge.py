@@ -0,0 +1,97 @@
+import pytest
+
+pytest.importorskip("requests")
+
+import chess_bridge
+
+
+class FakeResponse:
+    def __init__(self, status=200):
+        self.status = status
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise RuntimeError(f"HTTP {self.status}")
+
+
+class FakeClient:
+    def __init__(self):
+        self.scripts = []
+        self.fail = False
+        self.fail_at = None     # index of the one POST that should fail
+
+    def post(self, url, json=None, timeout=None):
+        assert url.endswith("/printer/gcode/script")
+        self.scripts.append(json["script"])
+        failed = self.fail or len(self.scripts) - 1 == self.fail_at
+        return FakeResponse(500 if failed else 200)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    fake = FakeClient()
+    monkeypatch.setattr(chess_bridge, "_CLIENT", fake)
+    monkeypatch.setattr(chess_bridge, "USE_MOVE_MACRO", False)
+    chess_bridge.reset_magnet_state()
+    yield fake
+    chess_bridge.reset_magnet_state()
+
+
+def test_move_piece_posts_one_script(client):
+    chess_bridge.move_piece("e2", "E4 ")
+    assert len(client.scripts) == 1
+    lines = client.scripts[0].split("\n")
+    assert lines[0].startswith("G0 " + chess_bridge._GCODE_FRAG["e2"])
+    assert lines[3].startswith("G0 " + chess_bridge._GCODE_FRAG["e4"])
+    assert lines[1].endswith(f"SPEED={chess_bridge.MAGNET_ON}")
+    assert lines[4].endswith(f"SPEED={chess_bridge.MAGNET_OFF}")
+
+
+def test_bad_square_is_rejected_before_sending(client):
+    with pytest.raises(ValueError):
+        chess_bridge.move_piece("e9", "e4")
+    assert client.scripts == []
+
+
+def test_single_command_helpers_send_before_returning(client):
+    chess_bridge.goto_xy(12.5, 40)
+    chess_bridge.dwell_ms(50)
+    assert client.scripts == ["G0 X12.500 Y40.000 F%d" % chess_bridge.FEED_MOVE, "G4 P50"]
+
+
+def test_single_command_failure_raises(client):
+    client.fail = True
+    with pytest.raises(RuntimeError):
+        chess_bridge.goto_square("a1")
+
+
+def test_failed_magnet_send_is_not_cached(client):
+    client.fail = True
+    with pytest.raises(RuntimeError):
+        chess_bridge.magnet(True)
+    client.fail = False
+    chess_bridge.magnet(True)
+    chess_bridge.magnet(True)   # now a cached no-op
+    assert len(client.scripts) == 2
+
+
+def test_failed_move_forgets_magnet_state(client):
+    chess_bridge.magnet(False)
+    client.fail = True
+    with pytest.raises(RuntimeError):
+        chess_bridge.move_piece("e2", "e4")
+    client.fail = False
+    chess_bridge.magnet(False)
+    assert client.scripts[-1].startswith("SET_FAN_SPEED")
+
+
+def test_commands_post_in_order_and_stop_at_first_failure(client):
+    client.fail_at = 1
+    with pytest.raises(RuntimeError):
+        chess_bridge.home_xy()
+        chess_bridge.move_piece("e2", "e4")
+        chess_bridge.goto_square("h8")
+    assert len(client.scripts) == 2
+    assert client.scripts[0].endswith("G28 X Y")
+    assert client.scripts[1].startswith("G0 " + chess_bridge._GCODE_FRAG["e2"])
+    assert chess_bridge._magnet_state is None
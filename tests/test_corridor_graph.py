@@ -0,0 +1,37 @@
+import pytest
+
+pytest.importorskip("chess")
+pytest.importorskip("pygame")
+
+from printer_sim import (
+    EDGES,
+    NODE_CENTER_BIT,
+    NODE_HC,
+    NODE_HR,
+    NODE_ID,
+    NODE_LIST,
+    NODE_NBRS,
+    NODE_XY,
+    SQUARE,
+    heuristic,
+)
+
+
+def test_frozen_neighbour_tables_match_built_graph():
+    assert len(NODE_NBRS) == len(NODE_LIST) == len(NODE_CENTER_BIT)
+    for i, node in enumerate(NODE_LIST):
+        assert [NODE_LIST[j] for j in NODE_NBRS[i]] == list(EDGES[node])
+        for j in NODE_NBRS[i]:
+            assert i in NODE_NBRS[j]
+        t, r, c = node
+        assert NODE_CENTER_BIT[i] == (1 << (r * 8 + c) if t == "C" else 0)
+
+
+def test_half_square_heuristic_equals_pixel_manhattan():
+    a8, h1 = ("C", 7, 0), ("C", 0, 7)
+    assert heuristic(a8, h1) == 14 * SQUARE
+    for node in NODE_LIST:
+        i = NODE_ID[node]
+        x, y = NODE_XY[node]
+        assert x == pytest.approx(NODE_XY[a8][0] + NODE_HC[i] * SQUARE / 2)
+        assert y == pytest.approx(NODE_XY[a8][1] + NODE_HR[i] * SQUARE / 2)
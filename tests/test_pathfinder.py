@@ -0,0 +1,32 @@
+import pytest
+
+from pathfinder import PathFinder, fr_from_alg
+
+
+@pytest.mark.parametrize(
+    "src, dst, expected_xs",
+    [
+        ("h1", "f1", [7.0, 6.0, 5.0]),        # e1 -> g1 castle, rook h1 -> f1
+        ("a1", "d1", [1.0, 2.0, 3.0]),        # e1 -> c1 castle, rook a1 -> d1
+        ("h8", "f8", [7.0, 6.0, 5.0]),        # e8 -> g8 castle, rook h8 -> f8
+        ("e1", "h1", [5.0, 6.0, 7.0]),
+        ("e1", "a1", [4.0, 3.0, 2.0, 1.0, 0.0]),
+        ("e8", "g8", [5.0, 6.0]),
+    ],
+)
+def test_rook_castle_path_walks_every_corridor(src, dst, expected_xs):
+    fr_from, fr_to = fr_from_alg(src), fr_from_alg(dst)
+    pts = PathFinder().path_rook_castle_units(fr_from, fr_to)
+
+    y = fr_from[1] + 0.5
+    assert pts[0] == (fr_from[0] + 0.5, y)
+    assert pts[-1] == (fr_to[0] + 0.5, y)
+    assert pts[1:-1] == [(x, y) for x in expected_xs]
+
+
+def test_knight_paths_come_from_precomputed_table():
+    pf = PathFinder()
+    assert len(pf._knight_cache) == 336
+    for (fr_from, fr_to), path in pf._knight_cache.items():
+        assert path == tuple(PathFinder._knight_path(fr_from, fr_to))
+    assert pf.path_knight_units((6, 0), (5, 2)) is pf._knight_cache[((6, 0), (5, 2))]
@@ -0,0 +1,75 @@
+import os
+
+import pytest
+
+chess = pytest.importorskip("chess")
+pygame = pytest.importorskip("pygame")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import virtual_board2 as vb
+
+
+def _ev(kind, **attrs):
+    return pygame.event.Event(kind, **attrs)
+
+
+def test_coalesce_motion_keeps_last_position_per_burst():
+    motion, finger = pygame.MOUSEMOTION, pygame.FINGERMOTION
+    events = [
+        _ev(motion, pos=(1, 1)),
+        _ev(motion, pos=(2, 2)),
+        _ev(pygame.MOUSEBUTTONUP, pos=(2, 2), button=1),
+        _ev(finger, finger_id=1, x=0.1, y=0.1),
+        _ev(finger, finger_id=2, x=0.5, y=0.5),
+        _ev(finger, finger_id=1, x=0.2, y=0.2),
+        _ev(motion, pos=(3, 3)),
+    ]
+    out = vb.coalesce_motion(events)
+    assert [e.type for e in out] == [motion, pygame.MOUSEBUTTONUP, finger, finger, motion]
+    # the burst before the release collapses to its last position, not past the button event
+    assert out[0].pos == (2, 2)
+    # each finger keeps its own latest sample
+    assert [(e.finger_id, e.x) for e in out[2:4]] == [(2, 0.5), (1, 0.2)]
+    assert out[4].pos == (3, 3)
+
+
+def _old_phys_to_logical(m, px, py):
+    # the pre-affine implementation, bounds check included
+    if px < m.dst_x or py < m.dst_y or px >= m.dst_x + m.dst_w or py >= m.dst_h:
+        return None
+    rx = (px - m.dst_x) / m.scale
+    ry = (py - m.dst_y) / m.scale
+    W, H = m.lw, m.lh
+    lx, ly = {0: (rx, ry), 90: (W - ry, rx), 180: (W - rx, H - ry), 270: (ry, H - rx)}[m.angle]
+    return (float(lx), float(ly))
+
+
+@pytest.mark.parametrize("angle", [0, 90, 180, 270])
+@pytest.mark.parametrize("screen", [(1616, 1280), (800, 1280), (1366, 768)])
+def test_affine_matches_per_angle_formulas(angle, screen):
+    m = vb.Mapper(screen, (vb.WIN_W, vb.WIN_H), angle)
+    for px in range(m.dst_x - 3, m.dst_x + m.dst_w + 3, 37):
+        for py in range(m.dst_y - 3, m.dst_y + m.dst_h + 3, 41):
+            assert m.phys_to_logical(px, py) == _old_phys_to_logical(m, px, py)
+
+
+@pytest.mark.parametrize("fen, reason", [
+    ("7k/5K2/6B1/8/8/8/8/8 b - - 0 1", "Stalemate — draw"),
+    ("7k/8/6K1/8/8/8/8/8 b - - 150 90", "75-move rule — draw"),
+    ("7k/8/6K1/8/8/8/8/8 b - - 0 1", "Insufficient material — draw"),
+    ("rnb1kbnr/pppp1ppp/8/4p3/6Pq/5P2/PPPPP2P/RNBQKBNR w KQkq - 1 3", "Checkmate — Black wins"),
+])
+def test_game_over_reason_text(fen, reason):
+    over, text, _ = vb.game_over_reason(chess.Board(fen))
+    assert over and text == reason
+
+
+def test_threefold_claim_ends_game_but_fifty_move_claim_does_not():
+    board = chess.Board()
+    for _ in range(2):
+        for uci in ("g1f3", "g8f6", "f3g1", "f6g8"):
+            board.push_uci(uci)
+    assert vb.game_over_reason(board)[1] == "Threefold repetition — draw"
+    fifty = chess.Board("7k/8/6K1/8/8/8/8/R7 b - - 100 80")
+    assert fifty.can_claim_fifty_moves()
+    assert vb.game_over_reason(fifty) == (False, "", "*")
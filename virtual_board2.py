@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import os, sys, shutil, threading, queue
-import pygame, chess, chess.engine
+import os, sys, shutil, threading, queue, collections, functools, weakref
+import pygame, pygame.gfxdraw, chess, chess.engine
 
 # -------------------- Printer bridge --------------------
 try:
@@ -54,6 +54,7 @@ COL_OVER   = (16, 16, 16, 200)
 
 DRAG_THRESH_PX = 6
 MATE_LOSS_DELAY_MS = 2000
+ENGINE_EVENT = pygame.USEREVENT + 1   # posted by EngineWorker whenever to_ui has news
 
 # -------------------- Fonts --------------------
 def _render_has_glyphs(font):
@@ -64,13 +65,12 @@ def _render_has_glyphs(font):
         return False
 
 def _try_load_bundled_font(filename, size):
+    """Bundled fonts are shipped for their chess glyphs, so they are not probed."""
     here = os.path.dirname(os.path.abspath(__file__))
     p = os.path.join(here, "assets", filename)
     if os.path.exists(p):
         try:
-            f = pygame.font.Font(p, size)
-            if _render_has_glyphs(f):
-                return f
+            return pygame.font.Font(p, size)
         except Exception:
             pass
     return None
@@ -89,11 +89,9 @@ def get_fonts():
                 pygame.font.SysFont(None, 42),
                 True,
             )
-    # System candidates
-    for name in [
-        "FreeSerif", "DejaVu Sans", "Noto Sans Symbols", "Noto Sans",
-        "Arial Unicode MS", "Symbola", "Segoe UI Symbol", None
-    ]:
+    # System candidates: each probe is a fontconfig lookup plus a test render,
+    # so only the two most likely families are tried before the letter fallback.
+    for name in ("FreeSerif", "DejaVu Sans"):
         try:
             fp = pygame.font.SysFont(name, size_piece)
             if _render_has_glyphs(fp):
@@ -134,6 +132,24 @@ LETTER = {
     chess.KING:   {chess.WHITE: "K", chess.BLACK: "k"},
 }
 
+# Flat per-piece tables indexed by (piece_type << 1) | (0 if white else 1);
+# slots 0-1 are unused because piece types start at 1.
+GLYPH_UNICODE = (None, None) + tuple(UNICODE[pt][col] for pt in range(chess.PAWN, chess.KING + 1)
+                                     for col in (chess.WHITE, chess.BLACK))
+GLYPH_LETTER  = (None, None) + tuple(LETTER[pt][col] for pt in range(chess.PAWN, chess.KING + 1)
+                                     for col in (chess.WHITE, chess.BLACK))
+
+# Pre-rendered glyphs in the flat GLYPH_* layout: (surface, (dx, dy)), where
+# (dx, dy) centers the glyph inside a square. Filled by build_piece_surfs().
+PIECE_SURFS = [None] * 14
+
+def build_piece_surfs(font_piece, use_unicode):
+    """Render the 12 piece glyphs once so drawing is a plain blit."""
+    glyphs = GLYPH_UNICODE if use_unicode else GLYPH_LETTER
+    for idx in range(2, 14):
+        surf = font_piece.render(glyphs[idx], True, (15, 15, 15)).convert_alpha()
+        PIECE_SURFS[idx] = (surf, ((SQUARE - surf.get_width())//2, (SQUARE - surf.get_height())//2))
+
 # -------------------- Rotation + scaling mapper --------------------
 def norm_angle(a):
     try:
@@ -143,6 +159,17 @@ def norm_angle(a):
     a = a % 360
     return {0:0,90:90,180:180,270:270}.get(a, 0)
 
+def rotate_rect(rect, angle, lw, lh):
+    """Where a rect on a lw x lh surface lands after pygame.transform.rotate(surf, angle)."""
+    x, y, w, h = rect
+    if angle == 90:   # CCW
+        return pygame.Rect(y, lw - x - w, h, w)
+    if angle == 180:
+        return pygame.Rect(lw - x - w, lh - y - h, w, h)
+    if angle == 270:
+        return pygame.Rect(lh - y - h, x, h, w)
+    return pygame.Rect(x, y, w, h)
+
 class Mapper:
     """
     Maps physical screen coords <-> logical canvas coords with rotation + scale + letterboxing.
@@ -171,6 +198,26 @@ class Mapper:
         self.dst_w, self.dst_h = int(round(rw * scale)), int(round(rh * scale))
         self.dst_x = (self.sw - self.dst_w) // 2
         self.dst_y = (self.sh - self.dst_h) // 2
+        # An exact integer upscale is a plain pixel replicate; filtering adds nothing there.
+        n = round(scale)
+        integer = n >= 1 and (self.dst_w, self.dst_h) == (rw * n, rh * n)
+        self._scaler = pygame.transform.scale if integer else pygame.transform.smoothscale
+
+        # Un-rotation as integer coefficients over the unscaled point (rx, ry):
+        # lx = a*rx + b*ry + c, ly = d*rx + e*ry + f. Integer terms keep the
+        # result bit-identical to the per-angle formulas it replaces.
+        W, H = self.lw, self.lh
+        self.affine = {
+            0:   (1, 0, 0, 0, 1, 0),
+            90:  (0, -1, W, 1, 0, 0),    # CCW
+            180: (-1, 0, W, 0, -1, H),
+            270: (0, 1, 0, -1, 0, H),
+        }[self.angle]
+
+        # Present-time buffers: the scaled frame is written straight into this
+        # window of the screen, and the letterbox bars are painted only once.
+        self._dst_screen = None
+        self._dst_view = None
 
         print(f"[mapper] angle={self.angle} scale={self.scale:.3f} dst={self.dst_x},{self.dst_y},{self.dst_w}x{self.dst_h} "
               f"touch swapXY={self.tswap} invX={self.tix} invY={self.tiy}")
@@ -194,28 +241,63 @@ class Mapper:
             return None
         rx = (px - self.dst_x) / self.scale
         ry = (py - self.dst_y) / self.scale
-
-        W, H = self.lw, self.lh
-        if self.angle == 0:
-            lx, ly = rx, ry
-        elif self.angle == 90:   # CCW
-            lx, ly = W - ry, rx
-        elif self.angle == 180:
-            lx, ly = W - rx, H - ry
-        elif self.angle == 270:
-            lx, ly = ry, H - rx
-        else:
-            lx, ly = rx, ry
-        return (float(lx), float(ly))
+        a, b, c, d, e, f = self.affine
+        return (a * rx + b * ry + c, d * rx + e * ry + f)
+
+    def logical_rect_to_phys(self, rect):
+        """Screen rect covering a logical rect, padded for the scaler's filter footprint."""
+        r = rotate_rect(rect, self.angle, self.lw, self.lh)
+        s = self.scale
+        pad = int(s) + 2
+        x0 = self.dst_x + int(r.x * s) - pad
+        y0 = self.dst_y + int(r.y * s) - pad
+        x1 = self.dst_x + int(r.right * s) + pad
+        y1 = self.dst_y + int(r.bottom * s) + pad
+        return pygame.Rect(x0, y0, x1 - x0, y1 - y0).clip(self.dst_x, self.dst_y, self.dst_w, self.dst_h)
 
     def blit_rotated_scaled(self, screen, logical_surface):
+        if screen is not self._dst_screen:
+            screen.fill((0,0,0))
+            self._dst_screen = screen
+            self._dst_view = screen.subsurface((self.dst_x, self.dst_y, self.dst_w, self.dst_h))
         surf = logical_surface
-        if self.angle:
+        if self.angle and not isinstance(surf, RotatedCanvas):
             surf = pygame.transform.rotate(surf, self.angle)
         if (surf.get_width(), surf.get_height()) != (self.dst_w, self.dst_h):
-            surf = pygame.transform.smoothscale(surf, (self.dst_w, self.dst_h))
-        screen.fill((0,0,0))
-        screen.blit(surf, (self.dst_x, self.dst_y))
+            self._scaler(surf, (self.dst_w, self.dst_h), self._dst_view)
+        else:
+            screen.blit(surf, (self.dst_x, self.dst_y))
+
+class RotatedCanvas(pygame.Surface):
+    """
+    Logical-size drawing target whose pixels are stored already rotated for the display.
+    blit/fill/draw_rect take logical coordinates; blit sources are rotated once and cached.
+    """
+    def __init__(self, logical_size, angle_deg, like):
+        self.lw, self.lh = logical_size
+        self.angle = norm_angle(angle_deg)
+        size = (self.lh, self.lw) if self.angle in (90, 270) else (self.lw, self.lh)
+        super().__init__(size, 0, like)
+        self._rotated = weakref.WeakKeyDictionary()   # source Surface -> rotated copy
+
+    def map_rect(self, rect):
+        return rotate_rect(rect, self.angle, self.lw, self.lh)
+
+    def blit(self, source, dest):
+        rot = self._rotated.get(source)
+        if rot is None:
+            rot = self._rotated[source] = pygame.transform.rotate(source, self.angle)
+        x, y = dest[0], dest[1]
+        return super().blit(rot, self.map_rect((x, y, source.get_width(), source.get_height())).topleft)
+
+    def fill(self, color, rect=None):
+        return super().fill(color, None if rect is None else self.map_rect(rect))
+
+def draw_rect(surface, color, rect, width=0, border_radius=0):
+    """pygame.draw.rect that also accepts a RotatedCanvas in logical coordinates."""
+    if isinstance(surface, RotatedCanvas):
+        rect = surface.map_rect(rect)
+    return pygame.draw.rect(surface, color, rect, width=width, border_radius=border_radius)
 
 # -------------------- Geometry helpers --------------------
 def board_to_screen_fr(file_i, rank_i, bottom_color_white):
@@ -229,19 +311,51 @@ def fr_to_xy(sf, sr):
     y = MARGIN + (7 - sr) * SQUARE
     return x, y
 
+BOARD_END = MARGIN + 8 * SQUARE   # exclusive right/bottom pixel edge of the board
+
+def _build_orientation_luts(bottom_color_white):
+    """Square<->screen-cell tables; a screen cell is encoded as sf*8 + sr."""
+    to_screen = [0] * 64
+    to_board  = [0] * 64
+    for sq in range(64):
+        sf, sr = board_to_screen_fr(sq & 7, sq >> 3, bottom_color_white)
+        code = (sf << 3) | sr
+        to_screen[sq] = code
+        to_board[code] = sq
+    return tuple(to_screen), tuple(to_board)
+
+_LUTS = {w: _build_orientation_luts(w) for w in (True, False)}
+SCREEN_TO_BOARD_SQ = {w: luts[1] for w, luts in _LUTS.items()}
+# Top-left screen corner of each chess square (index = square), per orientation.
+SQ_XY = {w: tuple(fr_to_xy(code >> 3, code & 7) for code in luts[0]) for w, luts in _LUTS.items()}
+del _LUTS
+# Matching screen rects (treat as read-only).
+SQ_RECT = {w: tuple(pygame.Rect(x, y, SQUARE, SQUARE) for x, y in xy) for w, xy in SQ_XY.items()}
+
 def mouse_to_board_square(mx, my, bottom_color_white):
-    if not (MARGIN <= mx < MARGIN + 8 * SQUARE and MARGIN <= my < MARGIN + 8 * SQUARE):
+    if not (MARGIN <= mx < BOARD_END and MARGIN <= my < BOARD_END):
         return None
-    sf = (mx - MARGIN) // SQUARE
-    sr_from_top = (my - MARGIN) // SQUARE
-    sr = 7 - sr_from_top
-    file_i, rank_i = screen_to_board_fr(sf, sr, bottom_color_white)
-    return chess.square(int(file_i), int(rank_i))
+    sf = int(mx - MARGIN) // SQUARE
+    sr = 7 - int(my - MARGIN) // SQUARE
+    return SCREEN_TO_BOARD_SQ[bottom_color_white][(sf << 3) | sr]
 
 # -------------------- Drawing --------------------
+_TEXT_CACHE = {}        # (font, text, color) -> rendered Surface
+_TEXT_CACHE_MAX = 64
+
+def render_cached(font, text, color):
+    key = (font, text, color)
+    surf = _TEXT_CACHE.get(key)
+    if surf is None:
+        if len(_TEXT_CACHE) >= _TEXT_CACHE_MAX:
+            del _TEXT_CACHE[next(iter(_TEXT_CACHE))]
+        surf = font.render(text, True, color).convert_alpha()
+        _TEXT_CACHE[key] = surf
+    return surf
+
 def draw_button(screen, rect, text, font, hovered=False):
-    pygame.draw.rect(screen, COL_BTN_H if hovered else COL_BTN, rect, border_radius=10)
-    label = font.render(text, True, COL_TEXT)
+    draw_rect(screen, COL_BTN_H if hovered else COL_BTN, rect, border_radius=10)
+    label = render_cached(font, text, COL_TEXT)
     screen.blit(label, (rect.centerx - label.get_width()//2, rect.centery - label.get_height()//2))
 
 def draw_board_squares(screen):
@@ -267,71 +381,104 @@ def draw_rank_labels(screen, font_small, bottom_color_white):
         lab = font_small.render(number, True, COL_TEXT)
         screen.blit(lab, (lx, ly))
 
+# Static layer per orientation: background, squares, labels and the UI bar.
+_BG_CACHE = {}
+
+def get_board_bg(bottom_color_white, font_small):
+    bg = _BG_CACHE.get(bottom_color_white)
+    if bg is None:
+        bg = pygame.Surface((WIN_W, WIN_H))
+        bg.fill(COL_BG)
+        draw_board_squares(bg)
+        draw_file_labels(bg, font_small, bottom_color_white)
+        draw_rank_labels(bg, font_small, bottom_color_white)
+        pygame.draw.rect(bg, (36,36,36), (0, BOARD_PIXELS + UI_PAD, WIN_W, UI_HEIGHT))
+        bg = _BG_CACHE[bottom_color_white] = bg.convert()
+    return bg
+
+# Translucent overlays, allocated once by build_overlays() after set_mode.
+_HI_SQ  = None   # last-move highlight
+_CHK_SQ = None   # king-in-check tint
+_SEL_SQ = None   # selection outline
+_DOT    = None   # legal-move dot
+_OVER_SURF = None   # full-window game-over dimmer
+DOT_R   = max(6, SQUARE // 8)
+DOT_SIZE = (2*DOT_R + 2, 2*DOT_R + 2)
+# Top-left blit position of the dot sprite centred on each square, per orientation.
+DOT_XY  = {w: tuple((x + SQUARE // 2 - DOT_R - 1, y + SQUARE // 2 - DOT_R - 1) for x, y in xy)
+           for w, xy in SQ_XY.items()}
+
+def build_overlays():
+    global _HI_SQ, _CHK_SQ, _SEL_SQ, _DOT, _OVER_SURF
+    _HI_SQ = pygame.Surface((SQUARE, SQUARE), pygame.SRCALPHA)
+    _HI_SQ.fill(COL_HI)
+    _HI_SQ = _HI_SQ.convert_alpha()
+    _CHK_SQ = pygame.Surface((SQUARE, SQUARE), pygame.SRCALPHA)
+    _CHK_SQ.fill(COL_CHECK)
+    _CHK_SQ = _CHK_SQ.convert_alpha()
+    _SEL_SQ = pygame.Surface((SQUARE, SQUARE), pygame.SRCALPHA)
+    pygame.draw.rect(_SEL_SQ, COL_SEL, (2, 2, SQUARE-4, SQUARE-4), width=3, border_radius=6)
+    _SEL_SQ = _SEL_SQ.convert_alpha()
+    # Antialiased edge; one pixel of slack so the AA ring is never clipped.
+    _DOT = pygame.Surface(DOT_SIZE, pygame.SRCALPHA)
+    pygame.gfxdraw.filled_circle(_DOT, DOT_R + 1, DOT_R + 1, DOT_R, COL_DOT)
+    pygame.gfxdraw.aacircle(_DOT, DOT_R + 1, DOT_R + 1, DOT_R, COL_DOT)
+    _DOT = _DOT.convert_alpha()
+    _OVER_SURF = pygame.Surface((WIN_W, WIN_H), pygame.SRCALPHA)
+    _OVER_SURF.fill(COL_OVER)
+    _OVER_SURF = _OVER_SURF.convert_alpha()
+
 def draw_last_move(screen, move, bottom_color_white):
     if not move:
         return
-    for sq in (move.from_square, move.to_square):
-        fi = chess.square_file(sq); ri = chess.square_rank(sq)
-        sf, sr = board_to_screen_fr(fi, ri, bottom_color_white)
-        x, y = fr_to_xy(sf, sr)
-        hi = pygame.Surface((SQUARE, SQUARE), pygame.SRCALPHA)
-        hi.fill(COL_HI)
-        screen.blit(hi, (x, y))
+    xy = SQ_XY[bottom_color_white]
+    screen.blit(_HI_SQ, xy[move.from_square])
+    screen.blit(_HI_SQ, xy[move.to_square])
 
 def draw_selection_outline(screen, sel_sq, bottom_color_white):
     if sel_sq is None:
         return
-    fi = chess.square_file(sel_sq); ri = chess.square_rank(sel_sq)
-    sf, sr = board_to_screen_fr(fi, ri, bottom_color_white)
-    x, y = fr_to_xy(sf, sr)
-    pygame.draw.rect(screen, COL_SEL, (x+2, y+2, SQUARE-4, SQUARE-4), width=3, border_radius=6)
-
-def draw_legal_dots(screen, legal_targets, bottom_color_white):
-    dot_r = max(6, SQUARE // 8)
-    for tsq in list(legal_targets):
-        try:
-            fi = chess.square_file(tsq); ri = chess.square_rank(tsq)
-            sf, sr = board_to_screen_fr(fi, ri, bottom_color_white)
-            cx = MARGIN + sf * SQUARE + SQUARE // 2
-            cy = MARGIN + (7 - sr) * SQUARE + SQUARE // 2
-            pygame.draw.circle(screen, COL_DOT, (cx, cy), dot_r)
-        except Exception:
-            legal_targets.discard(tsq)
-
-def draw_check_overlay(screen, board, bottom_color_white):
-    if board.is_check():
-        ksq = board.king(board.turn)
-        if ksq is not None:
-            kf = chess.square_file(ksq); kr = chess.square_rank(ksq)
-            sf, sr = board_to_screen_fr(kf, kr, bottom_color_white)
-            x, y = fr_to_xy(sf, sr)
-            chk = pygame.Surface((SQUARE, SQUARE), pygame.SRCALPHA)
-            chk.fill(COL_CHECK)
-            screen.blit(chk, (x, y))
-
-def draw_pieces(screen, board, font_piece, use_unicode, bottom_color_white, skip_sq=None):
-    for sq in chess.SQUARES:
-        if skip_sq is not None and sq == skip_sq:
+    screen.blit(_SEL_SQ, SQ_XY[bottom_color_white][sel_sq])
+
+def legal_dot_positions(targets_bb, bottom_color_white):
+    """Dot blit positions for every square set in the targets bitboard."""
+    xy = DOT_XY[bottom_color_white]
+    out = []
+    while targets_bb:
+        out.append(xy[(targets_bb & -targets_bb).bit_length() - 1])
+        targets_bb &= targets_bb - 1
+    return out
+
+def draw_legal_dots(screen, legal_dots):
+    for pos in legal_dots:
+        screen.blit(_DOT, pos)
+
+def check_square(board):
+    """Square of the side-to-move's king when it is in check, else None."""
+    return board.king(board.turn) if board.is_check() else None
+
+def draw_check_overlay(screen, check_sq, bottom_color_white):
+    if check_sq is not None:
+        screen.blit(_CHK_SQ, SQ_XY[bottom_color_white][check_sq])
+
+def draw_pieces(screen, board, bottom_color_white, skip_sq=None):
+    xy, surfs = SQ_XY[bottom_color_white], PIECE_SURFS
+    for sq, piece in board.piece_map().items():
+        if sq == skip_sq:
             continue
-        piece = board.piece_at(sq)
-        if not piece:
-            continue
-        fi = chess.square_file(sq); ri = chess.square_rank(sq)
-        sf, sr = board_to_screen_fr(fi, ri, bottom_color_white)
-        x, y = fr_to_xy(sf, sr)
-        glyph = UNICODE[piece.piece_type][piece.color] if use_unicode else LETTER[piece.piece_type][piece.color]
-        surf  = font_piece.render(glyph, True, (15, 15, 15))
-        screen.blit(surf, (x + (SQUARE - surf.get_width())//2, y + (SQUARE - surf.get_height())//2))
+        x, y = xy[sq]
+        surf, (dx, dy) = surfs[(piece.piece_type << 1) | (0 if piece.color else 1)]
+        screen.blit(surf, (x + dx, y + dy))
 
 # -------------------- Moves --------------------
 def try_make_move(board, from_sq, to_sq):
     if from_sq == to_sq: return False
-    uci = chess.square_name(from_sq) + chess.square_name(to_sq)
-    move = chess.Move.from_uci(uci)
-    piece = board.piece_at(from_sq)
-    if piece and piece.piece_type == chess.PAWN and chess.square_rank(to_sq) in (0, 7):
-        move = chess.Move.from_uci(uci + "q")
-    if move in board.legal_moves:
+    promotion = None
+    if board.piece_type_at(from_sq) == chess.PAWN and (to_sq >> 3) in (0, 7):
+        promotion = chess.QUEEN
+    move = chess.Move(from_sq, to_sq, promotion=promotion)
+    # is_legal checks just this move instead of walking the legal-move list
+    if board.is_legal(move):
         board.push(move)
         print("move:", move.uci())
         return True
@@ -346,37 +493,52 @@ def undo_smart_pair(board, human_color_white):
     return popped
 
 # -------------------- Game over --------------------
+# Draw terminations outcome() can report on its own.
+_DRAW_REASONS = {
+    chess.Termination.INSUFFICIENT_MATERIAL: "Insufficient material — draw",
+    chess.Termination.STALEMATE:             "Stalemate — draw",
+    chess.Termination.SEVENTYFIVE_MOVES:     "75-move rule — draw",
+    chess.Termination.FIVEFOLD_REPETITION:   "Fivefold repetition — draw",
+}
+
 def game_over_reason(board):
-    if board.is_checkmate():
-        winner = "White" if board.turn == chess.BLACK else "Black"
-        result = "1-0" if winner == "White" else "0-1"
-        return True, f"Checkmate — {winner} wins", result
-    if board.is_stalemate(): return True, "Stalemate — draw", "1/2-1/2"
-    if hasattr(board, "is_seventyfive_moves") and board.is_seventyfive_moves(): return True, "75-move rule — draw", "1/2-1/2"
-    if hasattr(board, "is_fivefold_repetition") and board.is_fivefold_repetition(): return True, "Fivefold repetition — draw", "1/2-1/2"
-    if board.is_insufficient_material(): return True, "Insufficient material — draw", "1/2-1/2"
-    if board.is_repetition(3) or board.can_claim_threefold_repetition(): return True, "Threefold repetition — draw", "1/2-1/2"
+    outcome = board.outcome()
+    if outcome is not None:
+        if outcome.termination == chess.Termination.CHECKMATE:
+            winner = "White" if outcome.winner == chess.WHITE else "Black"
+            return True, f"Checkmate — {winner} wins", outcome.result()
+        termination = outcome.termination
+        if termination == chess.Termination.INSUFFICIENT_MATERIAL:
+            # outcome() checks material first; keep the older precedence
+            # (stalemate, 75-move, fivefold, then material) for the reason text.
+            if board.is_stalemate():
+                termination = chess.Termination.STALEMATE
+            elif board.is_seventyfive_moves():
+                termination = chess.Termination.SEVENTYFIVE_MOVES
+            elif board.is_fivefold_repetition():
+                termination = chess.Termination.FIVEFOLD_REPETITION
+        return True, _DRAW_REASONS[termination], "1/2-1/2"
+    # Only the threefold claim is honoured; a fifty-move claim does not end the game.
+    if board.can_claim_threefold_repetition(): return True, "Threefold repetition — draw", "1/2-1/2"
     return False, "", "*"
 
 def draw_game_over_overlay(screen, fonts, reason_text):
     _, _, font_ui, font_title, _ = fonts
-    overlay = pygame.Surface((WIN_W, WIN_H), pygame.SRCALPHA)
-    overlay.fill(COL_OVER)
-    screen.blit(overlay, (0,0))
+    screen.blit(_OVER_SURF, (0,0))
     box_w, box_h = 520, 220
     rect = pygame.Rect((WIN_W - box_w)//2, (WIN_H - box_h)//2 - 20, box_w, box_h)
-    pygame.draw.rect(screen, (40,40,44), rect, border_radius=12)
-    pygame.draw.rect(screen, (70,70,74), rect, width=2, border_radius=12)
+    draw_rect(screen, (40,40,44), rect, border_radius=12)
+    draw_rect(screen, (70,70,74), rect, width=2, border_radius=12)
 
-    title = font_title.render("Game Over", True, COL_TEXT)
+    title = render_cached(font_title, "Game Over", COL_TEXT)
     screen.blit(title, (rect.centerx - title.get_width()//2, rect.y + 18))
 
-    reason = font_ui.render(reason_text, True, COL_ACC)
+    reason = render_cached(font_ui, reason_text, COL_ACC)
     screen.blit(reason, (rect.centerx - reason.get_width()//2, rect.y + 78))
 
     btn = pygame.Rect(rect.centerx - 100, rect.bottom - 70, 200, 48)
-    pygame.draw.rect(screen, COL_BTN, btn, border_radius=10)
-    label = font_ui.render("New Game", True, COL_TEXT)
+    draw_rect(screen, COL_BTN, btn, border_radius=10)
+    label = render_cached(font_ui, "New Game", COL_TEXT)
     screen.blit(label, (btn.centerx - label.get_width()//2, btn.centery - label.get_height()//2))
     return btn
 
@@ -423,38 +585,41 @@ def show_menu_quick(mapper, screen, canvas, f_ui, f_title, cur_color, cur_diff):
 
     start_btn = pygame.Rect((WIN_W - start_btn_w)//2, grid_y + grid_h + gap_y, start_btn_w, start_btn_h)
 
+    dirty = True  # recompose + present only when the selection changed
     while True:
-        # draw
-        canvas.fill((28,28,32))
-        title = f_title.render(title_text, True, COL_TEXT)
-        canvas.blit(title, (WIN_W//2 - title.get_width()//2, title_pos_y))
-
-        # color buttons
-        pygame.draw.rect(canvas, COL_BTN_H if color==chess.WHITE else COL_BTN, white_btn, border_radius=10)
-        pygame.draw.rect(canvas, COL_BTN_H if color==chess.BLACK else COL_BTN, black_btn, border_radius=10)
-        wlab = f_ui.render("White", True, COL_TEXT)
-        blab = f_ui.render("Black", True, COL_TEXT)
-        canvas.blit(wlab, (white_btn.centerx - wlab.get_width()//2, white_btn.centery - wlab.get_height()//2))
-        canvas.blit(blab, (black_btn.centerx - blab.get_width()//2, black_btn.centery - blab.get_height()//2))
-
-        # difficulty cells
-        for n, rect in cells:
-            pygame.draw.rect(canvas, COL_BTN_H if diff==n else COL_BTN, rect, border_radius=8)
-            lab = f_ui.render(str(n), True, COL_TEXT)
-            canvas.blit(lab, (rect.centerx - lab.get_width()//2, rect.centery - lab.get_height()//2))
-
-        # start
         ready = color in (chess.WHITE, chess.BLACK) and (1 <= diff <= 8)
-        pygame.draw.rect(canvas, (0,140,80) if ready else (60,60,60), start_btn, border_radius=10)
-        slab = f_ui.render("Start", True, (255,255,255) if ready else (200,200,200))
-        canvas.blit(slab, (start_btn.centerx - slab.get_width()//2, start_btn.centery - slab.get_height()//2))
+        if dirty:
+            canvas.fill((28,28,32))
+            title = render_cached(f_title, title_text, COL_TEXT)
+            canvas.blit(title, (WIN_W//2 - title.get_width()//2, title_pos_y))
+
+            # color buttons
+            draw_rect(canvas, COL_BTN_H if color==chess.WHITE else COL_BTN, white_btn, border_radius=10)
+            draw_rect(canvas, COL_BTN_H if color==chess.BLACK else COL_BTN, black_btn, border_radius=10)
+            wlab = render_cached(f_ui, "White", COL_TEXT)
+            blab = render_cached(f_ui, "Black", COL_TEXT)
+            canvas.blit(wlab, (white_btn.centerx - wlab.get_width()//2, white_btn.centery - wlab.get_height()//2))
+            canvas.blit(blab, (black_btn.centerx - blab.get_width()//2, black_btn.centery - blab.get_height()//2))
+
+            # difficulty cells
+            for n, rect in cells:
+                draw_rect(canvas, COL_BTN_H if diff==n else COL_BTN, rect, border_radius=8)
+                lab = render_cached(f_ui, str(n), COL_TEXT)
+                canvas.blit(lab, (rect.centerx - lab.get_width()//2, rect.centery - lab.get_height()//2))
+
+            # start
+            draw_rect(canvas, (0,140,80) if ready else (60,60,60), start_btn, border_radius=10)
+            slab = render_cached(f_ui, "Start", (255,255,255) if ready else (200,200,200))
+            canvas.blit(slab, (start_btn.centerx - slab.get_width()//2, start_btn.centery - slab.get_height()//2))
 
-        mapper.blit_rotated_scaled(screen, canvas)
-        pygame.display.flip()
+            mapper.blit_rotated_scaled(screen, canvas)
+            pygame.display.flip()
+            dirty = False
         clock.tick(60)
 
-        # input
-        for ev in pygame.event.get():
+        # input (drained as one batch per tick)
+        events = pygame.event.get()
+        for ev in events:
             if ev.type == pygame.QUIT:
                 raise SystemExit
             pos = None
@@ -465,11 +630,11 @@ def show_menu_quick(mapper, screen, canvas, f_ui, f_title, cur_color, cur_diff):
                 out = mapper.phys_to_logical(px, py); pos = (int(out[0]), int(out[1])) if out else None
             if not pos: continue
             mx, my = pos
-            if white_btn.collidepoint(mx,my): color = chess.WHITE
-            elif black_btn.collidepoint(mx,my): color = chess.BLACK
+            if white_btn.collidepoint(mx,my): color = chess.WHITE; dirty = True
+            elif black_btn.collidepoint(mx,my): color = chess.BLACK; dirty = True
             else:
                 for n, rect in cells:
-                    if rect.collidepoint(mx,my): diff = n; break
+                    if rect.collidepoint(mx,my): diff = n; dirty = True; break
                 if start_btn.collidepoint(mx,my) and ready:
                     return color, diff
 
@@ -479,18 +644,21 @@ class EngineWorker(threading.Thread):
         super().__init__(daemon=True)
         self.engine_path = engine_path
         self.to_engine   = queue.Queue()
-        self.to_ui       = queue.Queue()
+        self.to_ui       = collections.deque()   # guarded by _ui_lock
+        self._ui_lock    = threading.Lock()
         self._stopflag   = threading.Event()
         self._eng        = None
+        self._board      = chess.Board()   # reused across requests
+        self._fen        = self._board.fen()
 
     def run(self):
         if not self.engine_path:
-            self.to_ui.put(("error", "Engine path not found. Install Stockfish or set $STOCKFISH."))
+            self._post(("error", "Engine path not found. Install Stockfish or set $STOCKFISH."))
             return
         try:
             self._eng = chess.engine.SimpleEngine.popen_uci(self.engine_path)
         except Exception as e:
-            self.to_ui.put(("error", f"Engine start failed: {e}"))
+            self._post(("error", f"Engine start failed: {e}"))
             return
 
         while not self._stopflag.is_set():
@@ -507,13 +675,15 @@ class EngineWorker(threading.Thread):
                         self._eng.configure({"Skill Level": int(skill)})
                     except Exception:
                         pass
-                    board = chess.Board(fen)
+                    if fen != self._fen:
+                        self._board.set_fen(fen)
+                        self._fen = fen
                     limit = chess.engine.Limit(time=think_time)
-                    result = self._eng.play(board, limit)
+                    result = self._eng.play(self._board, limit)
                     mv = result.move
-                    self.to_ui.put(("bestmove", req_id, mv.uci() if mv else None))
+                    self._post(("bestmove", req_id, mv.uci() if mv else None))
                 except Exception as e:
-                    self.to_ui.put(("error", f"Engine play failed: {e}"))
+                    self._post(("error", f"Engine play failed: {e}"))
             elif msg[0] == "quit":
                 break
 
@@ -523,6 +693,21 @@ class EngineWorker(threading.Thread):
         except Exception:
             pass
 
+    def _post(self, msg):
+        with self._ui_lock:
+            self.to_ui.append(msg)
+        try:
+            pygame.event.post(pygame.event.Event(ENGINE_EVENT))
+        except pygame.error:
+            pass   # display already shut down
+
+    def drain(self):
+        """Take every pending UI message in one lock acquisition."""
+        with self._ui_lock:
+            msgs = list(self.to_ui)
+            self.to_ui.clear()
+        return msgs
+
     def stop(self):
         self._stopflag.set()
         self.to_engine.put(("quit",))
@@ -538,6 +723,7 @@ BOTTOM_PAD_Y = 10
 BOTTOM_LINE_GAP = 6
 SAFE_GAP = 12
 
+@functools.lru_cache(maxsize=64)
 def truncate_to_width(font, text, max_w):
     """Truncate with ellipsis if needed to fit max_w."""
     if font.size(text)[0] <= max_w:
@@ -559,9 +745,9 @@ def draw_bottom_status(canvas, font_ui, left_text, right_text):
     y1 = BOARD_PIXELS + UI_PAD + UI_HEIGHT - font_ui.get_height() - BOTTOM_PAD_Y
     y2 = y1 - font_ui.get_height() - BOTTOM_LINE_GAP
 
-    # Render surfaces (we may re-render after truncation)
-    left_srf = font_ui.render(left_text, True, COL_ACC)
-    right_srf = font_ui.render(right_text, True, COL_TEXT)
+    # Cached surfaces (we may swap in a truncated one below)
+    left_srf = render_cached(font_ui, left_text, COL_ACC)
+    right_srf = render_cached(font_ui, right_text, COL_TEXT)
 
     # Compute positions
     left_x = MARGIN
@@ -576,7 +762,7 @@ def draw_bottom_status(canvas, font_ui, left_text, right_text):
         # Truncate right line if somehow wider than full width minus margins
         if right_srf.get_width() > max_right_w:
             right_text = truncate_to_width(font_ui, right_text, max_right_w)
-            right_srf = font_ui.render(right_text, True, COL_TEXT)
+            right_srf = render_cached(font_ui, right_text, COL_TEXT)
         canvas.blit(left_srf, (left_x, y1))
         canvas.blit(right_srf, (WIN_W - MARGIN - right_srf.get_width(), y2))
     else:
@@ -584,10 +770,29 @@ def draw_bottom_status(canvas, font_ui, left_text, right_text):
         max_left_w = right_x - left_x - SAFE_GAP
         if left_srf.get_width() > max_left_w:
             left_text = truncate_to_width(font_ui, left_text, max_left_w)
-            left_srf = font_ui.render(left_text, True, COL_ACC)
+            left_srf = render_cached(font_ui, left_text, COL_ACC)
         canvas.blit(left_srf, (left_x, y1))
         canvas.blit(right_srf, (right_x, y1))
 
+# -------------------- Input --------------------
+_MOTION_TYPES = (pygame.MOUSEMOTION, pygame.FINGERMOTION)
+
+def coalesce_motion(events):
+    """Drop motion events superseded by a later one from the same pointer
+    before the next non-motion event; press/release order is preserved."""
+    kept, seen = [], set()
+    for ev in reversed(events):
+        if ev.type in _MOTION_TYPES:
+            key = (ev.type, getattr(ev, "finger_id", None))
+            if key in seen:
+                continue
+            seen.add(key)
+        else:
+            seen.clear()
+        kept.append(ev)
+    kept.reverse()
+    return kept
+
 # -------------------- Main --------------------
 def main():
     pygame.init()
@@ -608,10 +813,17 @@ def main():
 
     mapper = Mapper(screen_size, (WIN_W, WIN_H), app_rotate,
                     touch_swap_xy=t_swap_xy, touch_invert_x=t_invert_x, touch_invert_y=t_invert_y)
-    canvas = pygame.Surface((WIN_W, WIN_H)).convert_alpha()
+    # Drawn in logical coordinates but stored in display orientation, so
+    # presenting a frame never has to rotate it.
+    if mapper.angle:
+        canvas = RotatedCanvas((WIN_W, WIN_H), mapper.angle, screen)
+    else:
+        canvas = pygame.Surface((WIN_W, WIN_H)).convert()
 
     # Fonts
     f_piece, f_small, f_ui, f_title, unicode_ok = get_fonts()
+    build_piece_surfs(f_piece, unicode_ok)
+    build_overlays()
 
     # Engine
     worker = EngineWorker(ENGINE_PATH)
@@ -641,7 +853,19 @@ def main():
         hw_moves = []  # list of (from_alg, to_alg) we sent to printer in this game
 
         selected_sq   = None
-        legal_targets = set()
+        legal_dots = []   # dot blit positions for the selected piece
+        legal_by_from = {}       # from_sq -> bitboard of to_sqs, for the position at legal_ply_cached
+        legal_ply_cached = -1
+
+        def legal_targets_from(sq):
+            """Bitboard of legal to-squares of the piece on sq; one legal-move scan per ply."""
+            nonlocal legal_by_from, legal_ply_cached
+            if board.ply() != legal_ply_cached:
+                legal_by_from = {}
+                for m in board.legal_moves:
+                    legal_by_from[m.from_square] = legal_by_from.get(m.from_square, 0) | (1 << m.to_square)
+                legal_ply_cached = board.ply()
+            return legal_by_from.get(sq, 0)
         dragging      = False
         drag_from_sq  = None
         drag_surface  = None
@@ -662,6 +886,7 @@ def main():
         over_btn_rect = None
         result_str = "*"
         over_announced = False
+        checked_ply = -1     # move-stack length game_over_reason last ran for
         pending_game_over_until = None
         pending_over_reason = ""
         pending_result_str = "*"
@@ -670,46 +895,74 @@ def main():
         req_id = 0
         waiting_for_engine = False
         engine_error_text = ""
+        # Fixed for the whole game; the status text itself is served from render_cached.
+        info_left = f"Color: {'White' if human_color == chess.WHITE else 'Black'}  |  Difficulty: {difficulty}"
         if board.turn == engine_color and not is_over:
             req_id += 1
             waiting_for_engine = True
             worker.to_engine.put(("play", req_id, board.fen(), skill, think_time))
 
+        # redraw bookkeeping: only compose + present frames that changed
+        dirty = True
+        hover = (False, False)
+        lpos = None              # last logical pointer position seen in an event
+        pointer_moved = False
+        # Partial presents: what the last shown frame decorated and which pieces it showed.
+        # full_present forces a whole-screen flip (first frame, game-over overlay).
+        full_present = True
+        shown_rects  = []
+        shown_pieces = {}
+        shown_sig    = None
+        engine_news = True   # the menu may have swallowed an ENGINE_EVENT; drain once on entry
+
         running = True
         while running:
-            clock.tick(60)
+            # Sleep in SDL until input or an ENGINE_EVENT arrives unless a frame is
+            # pending or a drag is live; only a pending mate-loss delay needs a timeout.
+            if dirty or dragging:
+                events = pygame.event.get()
+            else:
+                timeout = 0
+                if pending_game_over_until is not None and not is_over:
+                    timeout = max(1, pending_game_over_until - pygame.time.get_ticks())
+                first = pygame.event.wait(timeout)
+                events = [] if first.type == pygame.NOEVENT else [first]
+                events += pygame.event.get()
+            now_ms = pygame.time.get_ticks()   # one timestamp for the whole iteration
 
             # Engine results
-            try:
-                while True:
-                    kind, *payload = worker.to_ui.get_nowait()
-                    if kind == "bestmove":
-                        resp_req_id, uci = payload
-                        if resp_req_id == req_id and waiting_for_engine and not is_over and uci:
-                            waiting_for_engine = False
-                            move = chess.Move.from_uci(uci)
-                            if move in board.legal_moves:
-                                board.push(move)
-                                last_move = move
-                                print("engine_move:", uci)
-                                if chess_bridge is not None:
-                                    try:
-                                        frm = chess.square_name(move.from_square)
-                                        to  = chess.square_name(move.to_square)
-                                        chess_bridge.move_piece(frm, to)
-                                        hw_moves.append((frm, to))
-                                    except Exception as e:
-                                        print(f"[bridge] engine move error: {e}")
-                    elif kind == "error":
-                        engine_error_text = payload[0]
-                        print("[engine]", engine_error_text)
+            if engine_news or any(ev.type == ENGINE_EVENT for ev in events):
+                engine_news = False
+                engine_msgs = worker.drain()
+            else:
+                engine_msgs = ()
+            for kind, *payload in engine_msgs:
+                dirty = True
+                if kind == "bestmove":
+                    resp_req_id, uci = payload
+                    if resp_req_id == req_id and waiting_for_engine and not is_over and uci:
                         waiting_for_engine = False
-            except queue.Empty:
-                pass
+                        move = chess.Move.from_uci(uci)
+                        if move in board.legal_moves:
+                            board.push(move)
+                            last_move = move
+                            print("engine_move:", uci)
+                            if chess_bridge is not None:
+                                try:
+                                    frm = chess.square_name(move.from_square)
+                                    to  = chess.square_name(move.to_square)
+                                    chess_bridge.move_piece(frm, to)
+                                    hw_moves.append((frm, to))
+                                except Exception as e:
+                                    print(f"[bridge] engine move error: {e}")
+                elif kind == "error":
+                    engine_error_text = payload[0]
+                    print("[engine]", engine_error_text)
+                    waiting_for_engine = False
 
             # Game over?
-            now_ms = pygame.time.get_ticks()
-            if not is_over:
+            if not is_over and checked_ply != len(board.move_stack):
+                checked_ply = len(board.move_stack)
                 end_now, reason_text, result_text = game_over_reason(board)
                 if end_now:
                     if board.is_checkmate():
@@ -730,10 +983,11 @@ def main():
             if is_over and not over_announced:
                 print(f'end_game reason="{over_reason}" result={result_str}')
                 over_announced = True
+                dirty = True
 
             # ---------- INPUT ----------
             def handle_press(mx, my):
-                nonlocal press_pos, selected_sq, legal_targets, dragging, drag_from_sq, drag_surface, drag_offset, running, bottom_color, difficulty, hw_moves
+                nonlocal press_pos, selected_sq, legal_dots, dragging, drag_from_sq, drag_surface, drag_offset, running, bottom_color, difficulty, hw_moves
                 press_pos = (mx, my)
 
                 # Undo
@@ -749,9 +1003,9 @@ def main():
                             except Exception as e:
                                 print(f"[bridge] undo reverse error: {e}")
                     # cancel any pending engine result
-                    nonlocal req_id, waiting_for_engine
-                    req_id += 1; waiting_for_engine = False
-                    selected_sq = None; legal_targets.clear(); dragging = False
+                    nonlocal req_id, waiting_for_engine, checked_ply
+                    req_id += 1; waiting_for_engine = False; checked_ply = -1
+                    selected_sq = None; legal_dots.clear(); dragging = False
                     drag_from_sq = None; drag_surface = None
                     return
 
@@ -779,16 +1033,16 @@ def main():
 
                 sq = mouse_to_board_square(mx, my, human_color)
                 if sq is None:
-                    selected_sq = None; legal_targets.clear(); press_pos = None
+                    selected_sq = None; legal_dots.clear(); press_pos = None
                 else:
                     piece = board.piece_at(sq)
                     if piece and piece.color == board.turn:
                         selected_sq = sq
-                        legal_targets = {m.to_square for m in board.legal_moves if m.from_square == sq}
+                        legal_dots = legal_dot_positions(legal_targets_from(sq), human_color)
                         dragging = False; drag_from_sq = None; drag_surface = None
                     else:
                         if selected_sq is None:
-                            legal_targets.clear(); press_pos = None
+                            legal_dots.clear(); press_pos = None
 
             def handle_drag(mx, my):
                 nonlocal dragging, drag_from_sq, drag_surface, drag_offset
@@ -800,16 +1054,14 @@ def main():
                     dragging = True; drag_from_sq = selected_sq
                     piece = board.piece_at(drag_from_sq)
                     if piece:
-                        glyph = UNICODE[piece.piece_type][piece.color] if unicode_ok else LETTER[piece.piece_type][piece.color]
-                        drag_surface = f_piece.render(glyph, True, (15,15,15))
-                        fi = chess.square_file(drag_from_sq); ri = chess.square_rank(drag_from_sq)
-                        sf, sr = board_to_screen_fr(fi, ri, human_color); bx, by = fr_to_xy(sf, sr)
-                        gx = bx + (SQUARE - drag_surface.get_width()) // 2
-                        gy = by + (SQUARE - drag_surface.get_height()) // 2
+                        drag_surface, (dx0, dy0) = PIECE_SURFS[(piece.piece_type << 1) | (0 if piece.color else 1)]
+                        bx, by = SQ_XY[human_color][drag_from_sq]
+                        gx = bx + dx0
+                        gy = by + dy0
                         drag_offset = (press_pos[0] - gx, press_pos[1] - gy)
 
             def handle_release(mx, my):
-                nonlocal dragging, drag_from_sq, drag_surface, selected_sq, legal_targets, last_move, req_id, waiting_for_engine
+                nonlocal dragging, drag_from_sq, drag_surface, selected_sq, legal_dots, last_move, req_id, waiting_for_engine
                 made_move = False
                 human_turn_and_ready = (board.turn == human_color and not waiting_for_engine)
                 if not human_turn_and_ready:
@@ -822,19 +1074,19 @@ def main():
                         last_move = board.move_stack[-1] if board.move_stack else None
                         made_move = True
                     dragging = False; drag_from_sq = None; drag_surface = None
-                    selected_sq = None; legal_targets.clear()
+                    selected_sq = None; legal_dots.clear()
                 else:
                     sq = mouse_to_board_square(mx, my, human_color)
                     if sq is not None and selected_sq is not None and sq != selected_sq:
-                        if try_make_move(board, selected_sq, sq):
+                        if (legal_targets_from(selected_sq) >> sq) & 1 and try_make_move(board, selected_sq, sq):
                             last_move = board.move_stack[-1] if board.move_stack else None
                             made_move = True
-                            selected_sq = None; legal_targets.clear()
+                            selected_sq = None; legal_dots.clear()
                         else:
                             p2 = board.piece_at(sq)
                             if p2 and p2.color == board.turn:
                                 selected_sq = sq
-                                legal_targets = {m.to_square for m in board.legal_moves if m.from_square == sq}
+                                legal_dots = legal_dot_positions(legal_targets_from(sq), human_color)
 
                 if made_move:
                     if chess_bridge is not None and last_move is not None:
@@ -852,7 +1104,7 @@ def main():
                             winner_color = chess.BLACK if board.turn == chess.WHITE else chess.WHITE
                             if winner_color != human_color:
                                 if pending_game_over_until is None:
-                                    pending_game_over_until = pygame.time.get_ticks() + MATE_LOSS_DELAY_MS
+                                    pending_game_over_until = now_ms + MATE_LOSS_DELAY_MS
                                     pending_over_reason = reason_text
                                     pending_result_str = result_text
                             else:
@@ -864,92 +1116,130 @@ def main():
                         req_id += 1; waiting_for_engine = True
                         worker.to_engine.put(("play", req_id, board.fen(), skill, think_time))
 
-            # Read events (mouse + finger)
-            for ev in pygame.event.get():
+            # Handle events (mouse + finger); only the latest position of a motion burst matters
+            for ev in coalesce_motion(events):
                 if ev.type == pygame.QUIT:
                     raise SystemExit
+                if ev.type not in (pygame.MOUSEMOTION, pygame.FINGERMOTION):
+                    dirty = True
 
                 if ev.type == pygame.MOUSEBUTTONDOWN and ev.button == 1:
-                    out = mapper.phys_to_logical(*ev.pos)
+                    out = lpos = mapper.phys_to_logical(*ev.pos); pointer_moved = True
                     if out: handle_press(int(out[0]), int(out[1]))
 
                 elif ev.type == pygame.MOUSEMOTION:
+                    out = lpos = mapper.phys_to_logical(*ev.pos); pointer_moved = True
                     buttons = pygame.mouse.get_pressed(num_buttons=3)
-                    if buttons[0]:
-                        out = mapper.phys_to_logical(*ev.pos)
-                        if out: handle_drag(int(out[0]), int(out[1]))
+                    if buttons[0] and out:
+                        handle_drag(int(out[0]), int(out[1]))
 
                 elif ev.type == pygame.MOUSEBUTTONUP and ev.button == 1:
-                    out = mapper.phys_to_logical(*ev.pos)
+                    out = lpos = mapper.phys_to_logical(*ev.pos); pointer_moved = True
                     if out: handle_release(int(out[0]), int(out[1]))
 
                 elif ev.type == pygame.FINGERDOWN:
                     px, py = mapper.finger_norm_to_phys(ev.x, ev.y)
-                    out = mapper.phys_to_logical(px, py)
+                    out = lpos = mapper.phys_to_logical(px, py); pointer_moved = True
                     if out: handle_press(int(out[0]), int(out[1]))
 
                 elif ev.type == pygame.FINGERMOTION:
                     px, py = mapper.finger_norm_to_phys(ev.x, ev.y)
-                    out = mapper.phys_to_logical(px, py)
+                    out = lpos = mapper.phys_to_logical(px, py); pointer_moved = True
                     if out: handle_drag(int(out[0]), int(out[1]))
 
                 elif ev.type == pygame.FINGERUP:
                     px, py = mapper.finger_norm_to_phys(ev.x, ev.y)
-                    out = mapper.phys_to_logical(px, py)
+                    out = lpos = mapper.phys_to_logical(px, py); pointer_moved = True
                     if out: handle_release(int(out[0]), int(out[1]))
 
-            # ---------- DRAW ----------
-            canvas.fill(COL_BG)
-            draw_board_squares(canvas)
-            draw_last_move(canvas, last_move, human_color)
-            draw_selection_outline(canvas, selected_sq, human_color)
-            draw_legal_dots(canvas, legal_targets, human_color)
-            draw_check_overlay(canvas, board, human_color)
-
-            skip_sq = drag_from_sq if dragging else None
-            draw_pieces(canvas, board, f_piece, unicode_ok, human_color, skip_sq=skip_sq)
-
-            # Drag preview
-            phys_mouse = pygame.mouse.get_pos()
-            lpos = mapper.phys_to_logical(*phys_mouse)
-            if dragging and drag_surface is not None and lpos:
-                mx, my = int(lpos[0]), int(lpos[1])
-                canvas.blit(drag_surface, (mx - drag_offset[0], my - drag_offset[1]))
-
-            draw_file_labels(canvas, f_small, human_color)
-            draw_rank_labels(canvas, f_small, human_color)
-
-            pygame.draw.rect(canvas, (36,36,36), (0, BOARD_PIXELS + UI_PAD, WIN_W, UI_HEIGHT))
-
-            # Hover states from logical cursor (okay if None on pure touch)
-            hover_undo = hover_reset = False
-            if lpos:
-                mmx, mmy = int(lpos[0]), int(lpos[1])
-                hover_undo  = btn_undo.collidepoint(mmx, mmy)
-                hover_reset = btn_reset.collidepoint(mmx, mmy)
-
-            draw_button(canvas, btn_undo,  "Undo",  f_ui, hover_undo)
-            draw_button(canvas, btn_reset, "Reset", f_ui, hover_reset)
-
-            # ------------ Non-overlapping bottom status ------------
-            info_left  = f"Color: {'White' if human_color == chess.WHITE else 'Black'}  |  Difficulty: {difficulty}"
-            if engine_error_text:
-                turn_txt = "Engine error"
-            elif board.turn == engine_color and not is_over and waiting_for_engine:
-                # keep same string, just fix layout; you mentioned 'engien' typo — leaving proper spelling here
-                turn_txt = "Engine thinking…"
-            else:
-                turn_txt = "White to move" if board.turn == chess.WHITE else "Black to move"
+            # Hover states only change when a pointer event moved the cursor
+            if pointer_moved:
+                pointer_moved = False
+                hover_prev = hover
+                hover = (False, False)
+                if lpos:
+                    mmx, mmy = int(lpos[0]), int(lpos[1])
+                    hover = (btn_undo.collidepoint(mmx, mmy), btn_reset.collidepoint(mmx, mmy))
+                if hover != hover_prev or dragging:
+                    dirty = True
+
+            # Skip frames whose visible state matches the last one presented
+            # (e.g. a click on empty margin); a menu hand-off always redraws.
+            if dirty:
+                sig = (board._transposition_key(), last_move, selected_sq, dragging,
+                       lpos if dragging else None, hover, is_over, waiting_for_engine, engine_error_text)
+                if sig == shown_sig and running:
+                    dirty = False
 
-            draw_bottom_status(canvas, f_ui, info_left, turn_txt)
-            # -------------------------------------------------------
+            # ---------- DRAW ----------
+            if dirty:
+                check_sq = check_square(board)
+                canvas.blit(get_board_bg(human_color, f_small), (0, 0))
+                draw_last_move(canvas, last_move, human_color)
+                draw_selection_outline(canvas, selected_sq, human_color)
+                draw_legal_dots(canvas, legal_dots)
+                draw_check_overlay(canvas, check_sq, human_color)
+
+                skip_sq = drag_from_sq if dragging else None
+                draw_pieces(canvas, board, human_color, skip_sq=skip_sq)
+
+                # Drag preview
+                if dragging and drag_surface is not None and lpos:
+                    mx, my = int(lpos[0]), int(lpos[1])
+                    drag_rect = drag_surface.get_rect(topleft=(mx - drag_offset[0], my - drag_offset[1]))
+                    canvas.blit(drag_surface, drag_rect.topleft)
+                else:
+                    drag_rect = None
+
+                hover_undo, hover_reset = hover
+                draw_button(canvas, btn_undo,  "Undo",  f_ui, hover_undo)
+                draw_button(canvas, btn_reset, "Reset", f_ui, hover_reset)
+
+                # ------------ Non-overlapping bottom status ------------
+                if engine_error_text:
+                    turn_txt = "Engine error"
+                elif board.turn == engine_color and not is_over and waiting_for_engine:
+                    # keep same string, just fix layout; you mentioned 'engien' typo — leaving proper spelling here
+                    turn_txt = "Engine thinking…"
+                else:
+                    turn_txt = "White to move" if board.turn == chess.WHITE else "Black to move"
 
-            over_btn_rect = None
-            if is_over:
-                over_btn_rect = draw_game_over_overlay(canvas, (f_piece, f_small, f_ui, f_title, unicode_ok), over_reason)
+                draw_bottom_status(canvas, f_ui, info_left, turn_txt)
+                # -------------------------------------------------------
 
-            mapper.blit_rotated_scaled(screen, canvas)
-            pygame.display.flip()
+                over_btn_rect = None
+                if is_over:
+                    over_btn_rect = draw_game_over_overlay(canvas, (f_piece, f_small, f_ui, f_title, unicode_ok), over_reason)
+
+                # Damage: this frame's and the last frame's decorations, squares
+                # whose piece changed, and the UI bar (buttons + status).
+                # Only the display upload is narrowed to it: the canvas above is
+                # still composed, and below scaled, as a whole frame.
+                frame_rects = [pygame.Rect(0, BOARD_PIXELS + UI_PAD, WIN_W, UI_HEIGHT)]
+                deco_sqs = (last_move.from_square, last_move.to_square) if last_move else ()
+                sq_rect = SQ_RECT[human_color]
+                for sq in (*deco_sqs, selected_sq, check_sq):
+                    if sq is not None:
+                        frame_rects.append(sq_rect[sq])
+                frame_rects += [pygame.Rect(pos, DOT_SIZE) for pos in legal_dots]
+                if drag_rect is not None:
+                    frame_rects.append(drag_rect)
+                pieces = board.piece_map()
+
+                mapper.blit_rotated_scaled(screen, canvas)
+                if full_present or is_over or not running:
+                    pygame.display.flip()
+                else:
+                    damage = shown_rects + frame_rects
+                    damage += [sq_rect[sq] for sq in pieces.keys() | shown_pieces.keys()
+                               if pieces.get(sq) != shown_pieces.get(sq)]
+                    pygame.display.update([mapper.logical_rect_to_phys(r) for r in damage])
+                full_present = is_over
+                shown_rects, shown_pieces, shown_sig = frame_rects, pieces, sig
+                dirty = False
+
+            if dragging:
+                clock.tick(60)
 
         # loop ended by Reset->Menu or GameOver->Menu
         bottom_color, difficulty = bottom_color, difficulty  # keep most recent values and show menu again